@@ -3,16 +3,20 @@
 
 import argparse
 import contextlib
+import hashlib
 import os
 import shutil
 import sys
+import time
 import traceback
 
+import peewee
+import playhouse.migrate
 import stem.util.term
 
 import darc.typing as typing
 from darc.const import DB, DB_WEB, DEBUG, FLAG_DB, PATH_ID, PATH_LN
-from darc.db import _redis_command, save_requests
+from darc.db import BULK_SIZE, _redis_command, save_requests
 from darc.link import parse_link
 from darc.model import (HostnameModel, HostnameQueueModel, HostsModel, RequestsHistoryModel,
                         RequestsModel, RequestsQueueModel, RobotsModel, SeleniumModel,
@@ -27,6 +31,19 @@ from darc.submit import SAVE_DB
 # wait for Redis connection?
 _WAIT_REDIS = bool(int(os.getenv('DARC_REDIS', '1')))
 
+# Lua script to migrate the hostname database from the legacy set data type
+#   KEYS[1] - name of the hostname database
+#   ARGV[1] - current timestamp
+_MIGRATE_HOSTNAME_SCRIPT = """
+if redis.call('TYPE', KEYS[1])['ok'] == 'set' then
+    local hosts = redis.call('SMEMBERS', KEYS[1])
+    redis.call('DEL', KEYS[1])
+    for _, host in ipairs(hosts) do
+        redis.call('ZADD', KEYS[1], ARGV[1], host)
+    end
+end
+"""
+
 
 def _exit():
     """Gracefully exit."""
@@ -55,6 +72,71 @@ def _exit():
     caller(_FREENET_PROC, 'wait')
 
 
+def _migrate_redis():
+    """Migrate the task queues.
+
+    The ``queue_hostname`` database created by earlier versions is a
+    **set**, then it will be converted to a **sorted set** atomically,
+    with the current timestamp as the scores of its hostnames.
+
+    """
+    _redis_command('eval', _MIGRATE_HOSTNAME_SCRIPT, 1, 'queue_hostname', time.time())
+
+
+def _migrate_db():
+    """Migrate the task queue tables.
+
+    The :class:`~darc.model.tasks.hostname.HostnameQueueModel` table
+    created by earlier versions has no ``hash`` column, then the column
+    will be added through :mod:`playhouse.migrate` and filled with the
+    sha256 hash values of the hostnames, keeping only the earliest record
+    of each hostname, before the unique index is created.
+
+    Note:
+        The function shall be called before creating the tables, as the
+        unique index on the ``hash`` column cannot be created on such table.
+
+    """
+    table = HostnameQueueModel._meta.table_name  # pylint: disable=protected-access
+    if not DB.table_exists(table):
+        return
+    if 'hash' in (column.name for column in DB.get_columns(table)):
+        return
+
+    migrator = playhouse.migrate.SchemaMigrator.from_database(DB)
+    playhouse.migrate.migrate(
+        migrator.add_column(table, 'hash', peewee.CharField(max_length=256, null=True)),
+    )
+
+    seen = set()
+    duplicates = list()
+    for model_id, hostname in (HostnameQueueModel
+                               .select(HostnameQueueModel.id, HostnameQueueModel.hostname)
+                               .order_by(HostnameQueueModel.timestamp)
+                               .tuples()):
+        if hostname in seen:
+            duplicates.append(model_id)
+            continue
+        seen.add(hostname)
+
+        (HostnameQueueModel
+         .update(hash=hashlib.sha256(hostname.encode()).hexdigest())
+         .where(HostnameQueueModel.id == model_id)
+         .execute())
+
+    for batch in peewee.chunked(duplicates, BULK_SIZE):
+        (HostnameQueueModel
+         .delete()
+         .where(HostnameQueueModel.id.in_(batch))
+         .execute())
+
+    playhouse.migrate.migrate(
+        migrator.add_not_null(table, 'hash'),
+    )
+    # same index name as :meth:`peewee.Database.create_tables` would use
+    HostnameQueueModel._schema.create_indexes()  # pylint: disable=protected-access
+
+
 def get_parser() -> typing.ArgumentParser:
     """Argument parser."""
     from darc import __version__  # pylint: disable=import-outside-toplevel
@@ -86,7 +168,13 @@ def main():
         if not FLAG_DB:
             _redis_command('set', 'darc', pid)
 
+    if not FLAG_DB:
+        _migrate_redis()
+
     if FLAG_DB:
+        with DB:
+            _migrate_db()
+
         while True:
             with contextlib.suppress(Exception):
                 with DB:
@@ -113,7 +201,9 @@ def main():
         if not FLAG_DB:
             _redis_command('delete', 'queue_hostname')
             _redis_command('delete', 'queue_requests')
+            _redis_command('delete', 'queue_requests_host')
             _redis_command('delete', 'queue_selenium')
+            _redis_command('delete', 'queue_selenium_host')
 
     link_list = list()
     for link in filter(None, map(lambda s: s.strip(), args.link)):
@@ -48,6 +48,9 @@ DARC_CPU = os.getenv('DARC_CPU')
 if DARC_CPU is not None:
     DARC_CPU = int(DARC_CPU)
 
+# thread number per crawler worker
+DARC_THREAD = int(os.getenv('DARC_THREAD', '1'))
+
 # use multiprocessing?
 FLAG_MP = bool(int(os.getenv('DARC_MULTIPROCESSING', '1')))
 FLAG_TH = bool(int(os.getenv('DARC_MULTITHREADING', '0')))
@@ -166,13 +169,18 @@ else:
     DARC_WAIT = None
 del _DARC_WAIT
 
+# Redis connection pool size
+REDIS_POOL = int(os.getenv('DARC_REDIS_POOL', '50'))
+
 # Redis client
 _REDIS_URL = os.getenv('REDIS_URL')
 if _REDIS_URL is None:
     REDIS = NotImplemented
     FLAG_DB = True
 else:
-    REDIS = redis.Redis.from_url(_REDIS_URL, decode_components=True)
+    REDIS = redis.Redis(connection_pool=redis.BlockingConnectionPool.from_url(
+        _REDIS_URL, decode_components=True, max_connections=REDIS_POOL, retry_on_timeout=True,
+    ))
     FLAG_DB = False
 
 # database instance
@@ -210,12 +218,12 @@ def get_lock() -> typing.Union[multiprocessing.Lock, threading.Lock, nullcontext
     """Get a lock.
 
     Returns:
-        Lock context based on :data:`~darc.const.FLAG_MP`
-        and :data:`~darc.const.FLAG_TH`.
+        Lock context based on :data:`~darc.const.FLAG_MP`,
+        :data:`~darc.const.FLAG_TH` and :data:`~darc.const.DARC_THREAD`.
 
     """
     if FLAG_MP:
         return multiprocessing.Lock()
-    if FLAG_TH:
+    if FLAG_TH or DARC_THREAD > 1:
         return threading.Lock()
     return nullcontext()
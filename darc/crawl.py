@@ -10,10 +10,6 @@ The :mod:`darc.crawl` module provides two types of crawlers.
 """
 
 import math
-import os
-import shutil
-import sys
-import traceback
 
 import requests
 import selenium.common.exceptions
@@ -22,22 +18,22 @@ import selenium.webdriver.common.proxy
 import stem
 import stem.control
 import stem.process
-import stem.util.term
 import urllib3
 
 from darc._compat import datetime
 from darc.const import FORCE, SE_EMPTY
-from darc.db import (drop_hostname, drop_requests, drop_selenium, have_hostname, save_requests,
-                     save_selenium)
-from darc.error import LinkNoReturn, render_error
+from darc.db import (batch, drop_hostname, drop_requests, drop_selenium, have_hostname,
+                     save_requests, save_selenium)
+from darc.error import LinkNoReturn
 from darc.link import Link
+from darc.logging import logger
 from darc.parse import (check_robots, extract_links, get_content_type, match_host, match_mime,
                         match_proxy)
 from darc.proxy.i2p import fetch_hosts, read_hosts
 from darc.proxy.null import fetch_sitemap, save_invalid
 from darc.requests import request_session
 from darc.save import save_headers
-from darc.selenium import request_driver
+from darc.selenium import drop_driver, request_driver
 from darc.sites import crawler_hook, loader_hook
 from darc.submit import submit_new_host, submit_requests, submit_selenium
 
@@ -113,17 +109,15 @@ def crawler(link: Link):
     (c.f. :func:`~darc.db.save_selenium`).
 
     """
-    print(f'[REQUESTS] Requesting {link.url}')
+    logger.info('[REQUESTS] Requesting %s', link.url)
     try:
         if match_proxy(link.proxy):
-            print(render_error(f'[REQUESTS] Ignored proxy type from {link.url} ({link.proxy})',
-                               stem.util.term.Color.YELLOW), file=sys.stderr)  # pylint: disable=no-member
+            logger.warning('[REQUESTS] Ignored proxy type from %s (%s)', link.url, link.proxy)
             drop_requests(link)
             return
 
         if match_host(link.host):
-            print(render_error(f'[REQUESTS] Ignored hostname from {link.url} ({link.proxy})',
-                               stem.util.term.Color.YELLOW), file=sys.stderr)  # pylint: disable=no-member
+            logger.warning('[REQUESTS] Ignored hostname from %s (%s)', link.url, link.proxy)
             drop_requests(link)
             return
 
@@ -139,8 +133,7 @@ def crawler(link: Link):
                 try:
                     fetch_sitemap(link)
                 except Exception:
-                    error = f'[Error fetching sitemap of {link.url}]' + os.linesep + traceback.format_exc() + '-' * shutil.get_terminal_size().columns  # pylint: disable=line-too-long
-                    print(render_error(error, stem.util.term.Color.CYAN), file=sys.stderr)  # pylint: disable=no-member
+                    logger.exception('[Error fetching sitemap of %s]', link.url)
                     partial = True
 
             if link.proxy == 'i2p':
@@ -148,8 +141,7 @@ def crawler(link: Link):
                 try:
                     fetch_hosts(link)
                 except Exception:
-                    error = f'[Error subscribing hosts from {link.url}]' + os.linesep + traceback.format_exc() + '-' * shutil.get_terminal_size().columns  # pylint: disable=line-too-long
-                    print(render_error(error, stem.util.term.Color.CYAN), file=sys.stderr)  # pylint: disable=no-member
+                    logger.exception('[Error subscribing hosts from %s]', link.url)
                     partial = True
 
             # submit data / drop hostname from db
@@ -158,81 +150,92 @@ def crawler(link: Link):
             submit_new_host(timestamp, link, partial=partial)
 
         if not FORCE and not check_robots(link):
-            print(render_error(f'[REQUESTS] Robots disallowed link from {link.url}',
-                               stem.util.term.Color.YELLOW), file=sys.stderr)  # pylint: disable=no-member
+            logger.warning('[REQUESTS] Robots disallowed link from %s', link.url)
             return
 
-        with request_session(link) as session:
-            try:
-                # requests session hook
-                response = crawler_hook(link, session)
-            except requests.exceptions.InvalidSchema as error:
-                print(render_error(f'[REQUESTS] Failed on {link.url} <{error}>',
-                                   stem.util.term.Color.RED), file=sys.stderr)  # pylint: disable=no-member
-                save_invalid(link)
-                drop_requests(link)
-                return
-            except requests.RequestException as error:
-                print(render_error(f'[REQUESTS] Failed on {link.url} <{error}>',
-                                   stem.util.term.Color.RED), file=sys.stderr)  # pylint: disable=no-member
-                save_requests(link, single=True)
-                return
-            except LinkNoReturn:
-                print(render_error(f'[REQUESTS] Removing from database: {link.url}',
-                                   stem.util.term.Color.YELLOW), file=sys.stderr)  # pylint: disable=no-member
-                drop_requests(link)
-                return
+        session = request_session(link)
+        try:
+            # requests session hook
+            response = crawler_hook(link, session)
+        except requests.exceptions.InvalidSchema as error:
+            logger.error('[REQUESTS] Failed on %s <%s>', link.url, error)
+            save_invalid(link)
+            drop_requests(link)
+            return
+        except requests.RequestException as error:
+            logger.error('[REQUESTS] Failed on %s <%s>', link.url, error)
+            save_requests(link, single=True)
+            return
+        except LinkNoReturn:
+            logger.warning('[REQUESTS] Removing from database: %s', link.url)
+            drop_requests(link)
+            return
 
+        try:
             # save headers
             save_headers(timestamp, link, response, session)
 
             # check content type
             ct_type = get_content_type(response)
-            if ct_type not in ['text/html', 'application/xhtml+xml']:
-                print(render_error(f'[REQUESTS] Generic content type from {link.url} ({ct_type})',
-                                   stem.util.term.Color.YELLOW), file=sys.stderr)  # pylint: disable=no-member
+            is_html = ct_type in ['text/html', 'application/xhtml+xml']
+            # probably hosts.txt
+            is_hosts = link.proxy == 'i2p' and ct_type in ['text/plain', 'text/text']
+            if not is_html:
+                logger.warning('[REQUESTS] Generic content type from %s (%s)', link.url, ct_type)
+
+                if match_mime(ct_type) and not is_hosts:
+                    # the (streamed) body is discarded on close
+                    drop_requests(link)
+                    return
+
+            try:
+                # read the (streamed) body
+                content = response.content
+            except requests.RequestException as error:
+                logger.error('[REQUESTS] Failed on %s <%s>', link.url, error)
+                save_requests(link, single=True)
+                return
 
-                # probably hosts.txt
-                if link.proxy == 'i2p' and ct_type in ['text/plain', 'text/text']:
-                    text = response.text
-                    save_requests(read_hosts(text))
+            if not is_html:
+                if is_hosts:
+                    save_requests(read_hosts(response.text))
 
                 if match_mime(ct_type):
                     drop_requests(link)
                     return
 
                 # submit data
-                data = response.content
-                submit_requests(timestamp, link, response, session, data, mime_type=ct_type, html=False)
+                submit_requests(timestamp, link, response, session, content, mime_type=ct_type, html=False)
 
                 return
 
-            html = response.content
+            html = content
             if not html:
-                print(render_error(f'[REQUESTS] Empty response from {link.url}',
-                                   stem.util.term.Color.RED), file=sys.stderr)  # pylint: disable=no-member
+                logger.error('[REQUESTS] Empty response from %s', link.url)
                 save_requests(link, single=True)
                 return
 
             # submit data
             submit_requests(timestamp, link, response, session, html, mime_type=ct_type, html=True)
 
-            # add link to queue
-            save_requests(extract_links(link, html), score=0, nx=True)
+            with batch():
+                # add link to queue
+                save_requests(extract_links(link, html), score=0, nx=True)
 
-            if not response.ok:
-                print(render_error(f'[REQUESTS] Failed on {link.url} [{response.status_code}]',
-                                   stem.util.term.Color.RED), file=sys.stderr)  # pylint: disable=no-member
-                save_requests(link, single=True)
-                return
+                if not response.ok:
+                    logger.error('[REQUESTS] Failed on %s [%s]', link.url, response.status_code)
+                    save_requests(link, single=True)
+                    return
 
-            # add link to queue
-            save_selenium(link, single=True, score=0, nx=True)
+                # add link to queue
+                save_selenium(link, single=True, score=0, nx=True)
+        finally:
+            # release the (streamed) connection
+            response.close()
     except Exception:
-        error = f'[Error from {link.url}]' + os.linesep + traceback.format_exc() + '-' * shutil.get_terminal_size().columns  # pylint: disable=line-too-long
-        print(render_error(error, stem.util.term.Color.CYAN), file=sys.stderr)  # pylint: disable=no-member
+        logger.exception('[Error from %s]', link.url)
         save_requests(link, single=True)
-    print(f'[REQUESTS] Requested {link.url}')
+    logger.info('[REQUESTS] Requested %s', link.url)
 
 
 def loader(link: Link):
@@ -281,64 +284,61 @@ def loader(link: Link):
        * :data:`darc.const.SE_WAIT`
 
     """
-    print(f'[SELENIUM] Loading {link.url}')
+    logger.info('[SELENIUM] Loading %s', link.url)
     try:
         # timestamp
         timestamp = datetime.now()
 
         # retrieve source from Chrome
-        with request_driver(link) as driver:
-            try:
-                # selenium driver hook
-                driver = loader_hook(link, driver)
-            except urllib3.exceptions.HTTPError as error:
-                print(render_error(f'[SELENIUM] Fail to load {link.url} <{error}>',
-                                   stem.util.term.Color.RED), file=sys.stderr)  # pylint: disable=no-member
-                save_selenium(link, single=True)
-                return
-            except selenium.common.exceptions.WebDriverException as error:
-                print(render_error(f'[SELENIUM] Fail to load {link.url} <{error}>',
-                                   stem.util.term.Color.RED), file=sys.stderr)  # pylint: disable=no-member
-                save_selenium(link, single=True)
-                return
-            except LinkNoReturn:
-                print(render_error(f'[SELENIUM] Removing from database: {link.url}',
-                                   stem.util.term.Color.YELLOW), file=sys.stderr)  # pylint: disable=no-member
-                drop_selenium(link)
-                return
+        driver = request_driver(link)
+        try:
+            # selenium driver hook
+            driver = loader_hook(link, driver)
+        except urllib3.exceptions.HTTPError as error:
+            logger.error('[SELENIUM] Fail to load %s <%s>', link.url, error)
+            drop_driver(link)
+            save_selenium(link, single=True)
+            return
+        except selenium.common.exceptions.WebDriverException as error:
+            logger.error('[SELENIUM] Fail to load %s <%s>', link.url, error)
+            drop_driver(link)
+            save_selenium(link, single=True)
+            return
+        except LinkNoReturn:
+            logger.warning('[SELENIUM] Removing from database: %s', link.url)
+            drop_selenium(link)
+            return
 
-            # get HTML source
-            html = driver.page_source
+        # get HTML source
+        html = driver.page_source
 
-            if html == SE_EMPTY:
-                print(render_error(f'[SELENIUM] Empty page from {link.url}',
-                                   stem.util.term.Color.RED), file=sys.stderr)  # pylint: disable=no-member
-                save_selenium(link, single=True)
-                return
+        if html == SE_EMPTY:
+            logger.error('[SELENIUM] Empty page from %s', link.url)
+            save_selenium(link, single=True)
+            return
 
-            screenshot = None
-            try:
-                # get maximum height
-                height = driver.execute_script('return document.body.scrollHeight')
+        screenshot = None
+        try:
+            # get maximum height
+            height = driver.execute_script('return document.body.scrollHeight')
 
-                # resize window (with some magic numbers)
-                if height < 1000:
-                    height = 1000
-                driver.set_window_size(1024, math.ceil(height * 1.1))
+            # resize window (with some magic numbers)
+            if height < 1000:
+                height = 1000
+            driver.set_window_size(1024, math.ceil(height * 1.1))
 
-                # take a full page screenshot
-                screenshot = driver.get_screenshot_as_base64()
-            except Exception as error:
-                print(render_error(f'[SELENIUM] Fail to save screenshot from {link.url} <{error}>',
-                                   stem.util.term.Color.RED), file=sys.stderr)  # pylint: disable=no-member
+            # take a full page screenshot
+            screenshot = driver.get_screenshot_as_base64()
+        except Exception as error:
+            logger.error('[SELENIUM] Fail to save screenshot from %s <%s>', link.url, error)
 
-            # submit data
-            submit_selenium(timestamp, link, html, screenshot)
+        # submit data
+        submit_selenium(timestamp, link, html, screenshot)
 
-            # add link to queue
-            save_requests(extract_links(link, html), score=0, nx=True)
+        # add link to queue
+        save_requests(extract_links(link, html), score=0, nx=True)
     except Exception:
-        error = f'[Error from {link.url}]' + os.linesep + traceback.format_exc() + '-' * shutil.get_terminal_size().columns  # pylint: disable=line-too-long
-        print(render_error(error, stem.util.term.Color.CYAN), file=sys.stderr)  # pylint: disable=no-member
+        logger.exception('[Error from %s]', link.url)
+        drop_driver(link)
         save_selenium(link, single=True)
-    print(f'[SELENIUM] Loaded {link.url}')
+    logger.info('[SELENIUM] Loaded %s', link.url)
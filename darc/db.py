@@ -19,9 +19,12 @@ convension with ``queue_`` prefix:
 * the :mod:`requests` database -- ``queue_requests`` (:class:`~darc.model.tasks.requests.RequestsQueueModel`)
 * the :mod:`selenium` database -- ``queue_selenium`` (:class:`~darc.model.tasks.selenium.SeleniumQueueModel`)
 
-For ``queue_hostname``, it is a `Redis`_ **set** data type;
-and for ``queue_requests`` and ``queue_selenium``, they
-are both `Redis`_ **sorted set** data type.
+All of them are `Redis`_ **sorted set** data type. For ``queue_hostname``,
+the scores are the timestamps when the hostnames were first seen; for
+``queue_requests`` and ``queue_selenium``, the members are the URLs of
+the links, and the overridden hostnames of links (if any) are stored
+in the `Redis`_ **hash** data type named with a ``_host`` suffix, i.e.
+``queue_requests_host`` and ``queue_selenium_host``.
 
 If :data:`~darc.const.FLAG_DB` is :data:`True`, then the
 module uses the RDS storage described by the :mod:`peewee`
@@ -31,19 +34,23 @@ models as backend.
 
 """
 
+import collections
 import contextlib
 import datetime
+import hashlib
 import math
 import os
 import pickle
-import pprint
+import random
 import shutil
 import sys
 import textwrap
+import threading
 import time
 import warnings
 
 import peewee
+import redis.exceptions as redis_exceptions
 import redis.lock as redis_lock
 import stem.util.term
 
@@ -54,23 +61,30 @@ from darc.const import DB as database
 from darc.const import FLAG_DB
 from darc.const import REDIS as redis
 from darc.const import TIME_CACHE, VERBOSE
-from darc.error import LockWarning, RedisCommandFailed, render_error
-from darc.link import Link
+from darc.error import RedisCommandFailed, render_error
+from darc.link import Link, parse_link
 from darc.model.tasks import HostnameQueueModel, RequestsQueueModel, SeleniumQueueModel
 from darc.parse import _check
 
 # use lock?
 REDIS_LOCK = bool(int(os.getenv('DARC_REDIS_LOCK', '0')))
 
-# Redis retry interval
+# Redis maximum retry interval
 REDIS_RETRY = float(os.getenv('DARC_REDIS_RETRY', '10'))
 if not math.isfinite(REDIS_RETRY):
     REDIS_RETRY = None
 
-# lock blocking timeout
-LOCK_TIMEOUT = float(os.getenv('DARC_LOCK_TIMEOUT', '10'))
-if not math.isfinite(LOCK_TIMEOUT):
-    LOCK_TIMEOUT = None
+# base interval of Redis retry backoff
+_REDIS_BACKOFF = 0.05
+
+# Redis errors to be retried
+_REDIS_ERRORS = (redis_exceptions.ConnectionError, redis_exceptions.TimeoutError, OSError)
+
+# Redis commands to be deferred in batch mode
+_BATCH_COMMANDS = frozenset(['zadd', 'zrem', 'hset', 'hsetnx', 'hdel'])
+#: threading.local: Thread-local storage of deferred Redis commands,
+#: c.f. :func:`~darc.db.batch`.
+_BATCH_LOCAL = threading.local()
 
 # bulk size
 BULK_SIZE = int(os.getenv('DARC_BULK_SIZE', '100'))
@@ -80,12 +94,273 @@ MAX_POOL = float(os.getenv('DARC_MAX_POOL', '100'))
 if math.isfinite(MAX_POOL):
     MAX_POOL = math.floor(MAX_POOL)
 
+# terminal width
+_TERM_COLS = shutil.get_terminal_size().columns
+
+# rendered header & separator lines for link pools
+_REQUESTS_HEADER = stem.util.term.format('-*- [REQUESTS] LINK POOL -*-',
+                                         stem.util.term.Color.MAGENTA)  # pylint: disable=no-member
+_SELENIUM_HEADER = stem.util.term.format('-*- [SELENIUM] LINK POOL -*-',
+                                         stem.util.term.Color.MAGENTA)  # pylint: disable=no-member
+_POOL_SEPARATOR = stem.util.term.format('-' * _TERM_COLS,
+                                        stem.util.term.Color.MAGENTA)  # pylint: disable=no-member
+
+#: Optional[float]: :data:`~darc.const.TIME_CACHE` in seconds.
+_TIME_CACHE_SEC = None if TIME_CACHE is None else TIME_CACHE.total_seconds()
+
+#: Dict[str, float]: Hostnames known to the current process, mapped to
+#: the timestamp when their records in the database expire.
+_HOSTNAME_CACHE = dict()
+#: threading.Lock: Lock guarding the pruning of :data:`~darc.db._HOSTNAME_CACHE`.
+_HOSTNAME_LOCK = threading.Lock()
+#: float: Timestamp of next pruning of :data:`~darc.db._HOSTNAME_CACHE`.
+_HOSTNAME_PRUNE = 0.0
+
+# pickle protocol 2+ opcode, which never starts a UTF-8 encoded URL
+_PICKLE_PREFIX = b'\x80'
+
+# Lua script to load links from a task queue and update their scores atomically
+#   KEYS[1] - name of the task queue
+#   KEYS[2] - name of the host hash of the task queue
+#   ARGV[1] - maximum score of links to be loaded
+#   ARGV[2] - maximum number of links to be loaded, ``-1`` for unlimited
+#   ARGV[3] - new score of loaded links, empty for no update
+_LOAD_SCRIPT = """
+local members = redis.call('ZRANGEBYSCORE', KEYS[1], 0, ARGV[1], 'LIMIT', 0, ARGV[2])
+if ARGV[3] ~= '' then
+    for _, member in ipairs(members) do
+        redis.call('ZADD', KEYS[1], 'XX', ARGV[3], member)
+    end
+end
+local hosts = {}
+for index, member in ipairs(members) do
+    hosts[index] = redis.call('HGET', KEYS[2], member)
+end
+return {members, hosts}
+"""
+#: Optional[redis.client.Script]: Registered :data:`~darc.db._LOAD_SCRIPT`.
+_LOAD_SCRIPT_OBJ = None
+
+# Lua script to check and record a hostname atomically
+#   KEYS[1] - name of the hostname database
+#   ARGV[1] - hostname to be checked
+#   ARGV[2] - current timestamp
+#   ARGV[3] - minimum timestamp of known hostnames, empty for no expiry
+# returns ``{flag, timestamp}``, where ``flag`` is ``1`` for known and ``0``
+# for new hostnames, and ``timestamp`` is when the hostname was first seen
+_HOSTNAME_SCRIPT = """
+local score = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if score and (ARGV[3] == '' or tonumber(score) >= tonumber(ARGV[3])) then
+    return {1, score}
+end
+if ARGV[3] ~= '' then
+    redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', '(' .. ARGV[3])
+end
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+return {0, ARGV[2]}
+"""
+#: Optional[redis.client.Script]: Registered :data:`~darc.db._HOSTNAME_SCRIPT`.
+_HOSTNAME_SCRIPT_OBJ = None
+
+#: Dict[str, Set[str]]: URLs already saved to each task queue
+#: (with ``nx``) by the current process.
+_SEEN_URLS = collections.defaultdict(set)
+#: threading.Lock: Lock guarding :data:`~darc.db._SEEN_URLS`.
+_SEEN_LOCK = threading.Lock()
+#: int: Maximum number of URLs remembered per task queue.
+_SEEN_LIMIT = 1_000_000
+
+
+def _filter_seen(name: str, entries: typing.Iterable[Link]) -> typing.List[Link]:
+    """Filter out links already saved to the task queue.
+
+    Args:
+        name: Name of the task queue.
+        entries: Links to be saved.
+
+    Returns:
+        Links not yet seen by the current process, with duplicates removed.
+
+    Note:
+        The URLs are remembered in :data:`~darc.db._SEEN_URLS`, which will
+        be reset once exceeding :data:`~darc.db._SEEN_LIMIT`.
+
+    """
+    link_list = list()
+    with _SEEN_LOCK:
+        seen = _SEEN_URLS[name]
+        if len(seen) > _SEEN_LIMIT:
+            seen.clear()
+
+        for link in entries:
+            if link.url in seen:
+                continue
+            seen.add(link.url)
+            link_list.append(link)
+    return link_list
+
+
+def _dump_link(link: Link) -> bytes:
+    """Dump link as a Redis sorted set member.
+
+    Args:
+        link: Link to be dumped.
+
+    Returns:
+        The UTF-8 encoded URL of ``link``.
+
+    """
+    return link.url.encode()
+
+
+def _dump_host(link: Link) -> typing.Optional[str]:
+    """Dump the overridden hostname of link.
+
+    Args:
+        link: Link to be dumped.
+
+    Returns:
+        The hostname of ``link`` if it was overridden when parsing, i.e.
+        differs from what :func:`~darc.link.parse_link` produces from the
+        URL alone, which shall be stored in the host hash of the task queue;
+        otherwise :data:`None`.
+
+    """
+    if link.host == (link.url_parse.netloc or link.url_parse.hostname):
+        return None
+    # pseudo hostnames, e.g. ``(data)`` for data URIs
+    if link.host == parse_link(link.url).host:
+        return None
+    return link.host
+
+
+def _load_link(member: bytes, host: typing.Optional[bytes] = None) -> Link:
+    """Load link from a Redis sorted set member.
+
+    Args:
+        member: Member dumped by :func:`~darc.db._dump_link`.
+        host: Overridden hostname dumped by :func:`~darc.db._dump_host`.
+
+    Returns:
+        The link parsed from the URL, or unpickled if ``member``
+        is a legacy :mod:`pickle` dump.
+
+    """
+    if member.startswith(_PICKLE_PREFIX):
+        return pickle.loads(member)
+    return parse_link(member.decode(), host=None if host is None else host.decode())
+
+
+def _redis_save(name: str, entries: typing.List[Link], score: float,
+                nx: bool = False, xx: bool = False) -> typing.List[typing.Tuple[str, tuple, dict]]:
+    """Generate Redis commands to save links to a task queue.
+
+    Args:
+        name: Name of the task queue.
+        entries: Links to be saved.
+        score: Score to for the Redis sorted set.
+        nx: Forces ``ZADD`` to only create new elements.
+        xx: Forces ``ZADD`` to only update scores of elements.
+
+    Returns:
+        The ``ZADD`` commands of each *bulk* of links (c.f. :data:`~darc.db.BULK_SIZE`),
+        with ``HSET`` commands to the host hash (``<name>_host``) for links
+        with overridden hostnames, to be sent through :func:`~darc.db._redis_pipeline`.
+
+    Note:
+        With ``nx``, the hostnames are set through ``HSETNX`` instead,
+        so that existing links will keep their hostnames as well.
+
+    """
+    commands = list()
+    for i in range(0, len(entries), BULK_SIZE):
+        bulk = entries[i:i + BULK_SIZE]
+        commands.append(('zadd', (name, {_dump_link(link): score for link in bulk}), dict(nx=nx, xx=xx)))
+
+        if xx:
+            continue
+        host_map = {link.url: link.host for link in bulk if _dump_host(link) is not None}
+        if not host_map:
+            continue
+        if nx:
+            commands.extend(('hsetnx', (f'{name}_host', url, host), dict()) for url, host in host_map.items())
+        else:
+            commands.append(('hset', (f'{name}_host',), dict(mapping=host_map)))
+    return commands
+
+
+def _conflict_target(field: peewee.Field) -> typing.Optional[typing.List[peewee.Field]]:
+    """Get conflict target for upsert queries.
+
+    Args:
+        field: The unique field to detect conflicts.
+
+    Returns:
+        A list of ``field`` as the conflict target; or :data:`None`
+        for MySQL, as its ``ON DUPLICATE KEY UPDATE`` clause does not
+        accept a conflict target.
+
+    """
+    if isinstance(database, peewee.MySQLDatabase):
+        return None
+    return [field]
+
+
+@contextlib.contextmanager
+def batch() -> typing.Iterator[None]:
+    """Batch Redis write operations.
+
+    Within the context, the ``ZADD``, ``ZREM``, ``HSET``, ``HSETNX`` and ``HDEL`` commands issued by
+    :func:`~darc.db.save_requests`, :func:`~darc.db.save_selenium`,
+    :func:`~darc.db.drop_requests` and :func:`~darc.db.drop_selenium`
+    in current thread are deferred, and will be sent in one round trip
+    through :func:`~darc.db._redis_pipeline` on exit.
+
+    Note:
+        Nested contexts are merged into the outermost one. If
+        :data:`~darc.const.FLAG_DB` is :data:`True`, the context
+        manager has no effect.
+
+    """
+    if FLAG_DB or getattr(_BATCH_LOCAL, 'commands', None) is not None:
+        yield
+        return
+
+    _BATCH_LOCAL.commands = list()
+    try:
+        yield
+    finally:
+        commands = _BATCH_LOCAL.commands
+        _BATCH_LOCAL.commands = None
+        if commands:
+            _redis_pipeline(commands)
+
+
+def _redis_backoff(retry: int) -> typing.Optional[float]:
+    """Get the interval before next Redis retry.
+
+    Args:
+        retry: Number of failed attempts so far, starting from ``0``.
+
+    Returns:
+        A random interval (*full jitter*) up to the exponential backoff
+        of :data:`~darc.db._REDIS_BACKOFF`, which is capped by
+        :data:`~darc.db.REDIS_RETRY`; or :data:`None` if no interval
+        shall be applied.
 
-def _redis_command(command: str, *args, **kwargs) -> typing.Any:
+    """
+    if REDIS_RETRY is None:
+        return None
+    return random.uniform(0, min(REDIS_RETRY, _REDIS_BACKOFF * 2 ** min(retry, 32)))
+
+
+def _redis_command(command: typing.Union[str, typing.Callable[..., typing.Any]],
+                   *args, **kwargs) -> typing.Any:
     """Wrapper function for Redis command.
 
     Args:
-        command: Command name.
+        command: Command name, or a callable to be called,
+            e.g. a registered :class:`redis.client.Script`.
         *args: Arbitrary arguments for the Redis command.
 
     Keyword Args:
@@ -95,20 +370,34 @@ def _redis_command(command: str, *args, **kwargs) -> typing.Any:
         Values returned from the Redis command.
 
     Warns:
-        RedisCommandFailed: Warns at each round when the command failed.
+        RedisCommandFailed: Warns at each round when the command failed
+            with connection errors (c.f. :data:`~darc.db._REDIS_ERRORS`);
+            other errors will be raised directly.
 
     See Also:
-        Between each retry, the function sleeps for :data:`~darc.db.REDIS_RETRY`
-        second(s) if such value is **NOT** :data:`None`.
+        Between each retry, the function sleeps with exponential backoff
+        up to :data:`~darc.db.REDIS_RETRY` second(s) if such value is
+        **NOT** :data:`None`, c.f. :func:`~darc.db._redis_backoff`.
 
     """
     _arg_msg = None
 
-    method = getattr(redis, command)
+    if isinstance(command, str) and command in _BATCH_COMMANDS:
+        commands = getattr(_BATCH_LOCAL, 'commands', None)
+        if commands is not None:
+            commands.append((command, args, kwargs))
+            return None
+
+    retry = 0
+    if callable(command):
+        method = command
+        command = getattr(command, '__name__', 'evalsha')
+    else:
+        method = getattr(redis, command)
     while True:
         try:
             value = method(*args, **kwargs)
-        except Exception as error:
+        except _REDIS_ERRORS as error:
             if _arg_msg is None:
                 _args = ', '.join(map(repr, args))
                 _kwargs = ', '.join(f'{k}={v!r}' for k, v in kwargs.items())
@@ -116,19 +405,127 @@ def _redis_command(command: str, *args, **kwargs) -> typing.Any:
                     if _args:
                         _args += ', '
                     _args += _kwargs
-                _arg_msg = textwrap.shorten(_args, shutil.get_terminal_size().columns)
+                _arg_msg = textwrap.shorten(_args, _TERM_COLS)
 
             warning = warnings.formatwarning(error, RedisCommandFailed, __file__, 85,
                                              f'value = redis.{command}({_arg_msg})')
             print(render_error(warning, stem.util.term.Color.YELLOW), end='', file=sys.stderr)  # pylint: disable=no-member
 
-            if REDIS_RETRY is not None:
-                time.sleep(REDIS_RETRY)
+            interval = _redis_backoff(retry)
+            if interval is not None:
+                time.sleep(interval)
+            retry += 1
             continue
         break
     return value
 
 
+def _redis_pipeline(commands: typing.List[typing.Tuple[str, tuple, dict]]) -> typing.List[typing.Any]:
+    """Wrapper function for Redis pipeline.
+
+    Args:
+        commands: Redis commands to be executed, as tuples of the
+            command name, positional arguments and keyword arguments.
+
+    Return:
+        Values returned from the Redis commands.
+
+    Warns:
+        RedisCommandFailed: Warns at each round when the pipeline failed
+            with connection errors (c.f. :data:`~darc.db._REDIS_ERRORS`);
+            other errors will be raised directly.
+
+    See Also:
+        Between each retry, the function sleeps with exponential backoff
+        up to :data:`~darc.db.REDIS_RETRY` second(s) if such value is
+        **NOT** :data:`None`, c.f. :func:`~darc.db._redis_backoff`.
+
+    Note:
+        The commands are sent in one round trip through a *non-transactional*
+        pipeline, i.e. ``redis.pipeline(transaction=False)``, and the whole
+        pipeline will be resent on failure.
+
+        Within :func:`~darc.db.batch`, the commands will be deferred
+        until the context exits.
+
+    """
+    pending = getattr(_BATCH_LOCAL, 'commands', None)
+    if pending is not None:
+        pending.extend(commands)
+        return list()
+
+    _arg_msg = None
+
+    retry = 0
+    while True:
+        pipeline = redis.pipeline(transaction=False)
+        for command, args, kwargs in commands:
+            getattr(pipeline, command)(*args, **kwargs)
+
+        try:
+            value = pipeline.execute()
+        except _REDIS_ERRORS as error:
+            if _arg_msg is None:
+                _args = ', '.join(command for command, _, _ in commands)
+                _arg_msg = textwrap.shorten(_args, _TERM_COLS)
+
+            warning = warnings.formatwarning(error, RedisCommandFailed, __file__, 206,
+                                             f'value = redis.pipeline({_arg_msg}).execute()')
+            print(render_error(warning, stem.util.term.Color.YELLOW), end='', file=sys.stderr)  # pylint: disable=no-member
+
+            interval = _redis_backoff(retry)
+            if interval is not None:
+                time.sleep(interval)
+            retry += 1
+            continue
+        break
+    return value
+
+
+def _redis_load(name: str, max_score: float,
+                new_score: typing.Optional[float] = None) -> typing.List[Link]:
+    """Load links from a task queue.
+
+    Args:
+        name: Name of the task queue.
+        max_score: Maximum score of links to be loaded.
+        new_score: New score of the loaded links, if any.
+
+    Returns:
+        List of loaded links, at most :data:`~darc.db.MAX_POOL`.
+
+    Note:
+        The links are loaded and their scores are updated atomically through
+        the Lua script :data:`~darc.db._LOAD_SCRIPT`, i.e. in one round trip
+        and without a Redis lock.
+
+        The overridden hostnames of the links are loaded from the host hash
+        of the task queue at the same time. Legacy members dumped through
+        :mod:`pickle` will be migrated to URL keys (c.f. :func:`~darc.db._dump_link`).
+
+    """
+    global _LOAD_SCRIPT_OBJ
+
+    if _LOAD_SCRIPT_OBJ is None:
+        _LOAD_SCRIPT_OBJ = redis.register_script(_LOAD_SCRIPT)
+
+    limit = MAX_POOL if math.isfinite(MAX_POOL) else -1
+    member_list, host_list = _redis_command(_LOAD_SCRIPT_OBJ, keys=[name, f'{name}_host'],
+                                            args=[max_score, limit, '' if new_score is None else new_score])
+    link_pool = [_load_link(member, host) for member, host in zip(member_list, host_list)]
+
+    # migrate pickled members to URL keys
+    legacy_list = [(member, link) for member, link in zip(member_list, link_pool)
+                   if member.startswith(_PICKLE_PREFIX)]
+    if legacy_list:
+        score = time.time() if new_score is None else new_score
+        _redis_pipeline([
+            ('zrem', (name, *(member for member, _ in legacy_list)), dict()),
+            *_redis_save(name, [link for _, link in legacy_list], score),
+        ])
+    return link_pool
+
+
 def _redis_get_lock(name: str,
                     timeout: typing.Optional[float] = None,
                     sleep: float = 0.1,
@@ -154,11 +551,13 @@ def _redis_get_lock(name: str,
         that mimics the behavior of :class:`threading.Lock`.
 
     Seel Also:
-        If :data:`~darc.db.REDIS_LOCK` is :data:`False`, returns a
+        If :data:`~darc.db.REDIS_LOCK` is :data:`False`, or within
+        :func:`~darc.db.batch` (where the commands are only deferred
+        and nothing is sent to Redis under the lock), returns a
         :class:`contextlib.nullcontext` instead.
 
     """
-    if REDIS_LOCK:
+    if REDIS_LOCK and getattr(_BATCH_LOCAL, 'commands', None) is None:
         return _redis_command('lock', name, timeout, sleep, blocking_timeout, lock_class, thread_local)
     return nullcontext()
 
@@ -172,18 +571,45 @@ def have_hostname(link: Link) -> bool:
     Returns:
         If such link is a new host.
 
+    Note:
+        Hostnames already checked by the current process are cached
+        in :data:`~darc.db._HOSTNAME_CACHE` until their records in the
+        database expire (c.f. :data:`~darc.const.TIME_CACHE`), so that
+        the database will not be queried for every link. Expired entries
+        are pruned at most once per :data:`~darc.const.TIME_CACHE`.
+
     See Also:
         * :func:`darc.db._have_hostname_db`
         * :func:`darc.db._have_hostname_redis`
 
     """
+    global _HOSTNAME_PRUNE
+
+    now = time.time()
+
+    expiry = _HOSTNAME_CACHE.get(link.host)
+    if expiry is not None and now < expiry:
+        return True
+
+    if _TIME_CACHE_SEC is not None and now >= _HOSTNAME_PRUNE:
+        with _HOSTNAME_LOCK:
+            if now >= _HOSTNAME_PRUNE:
+                _HOSTNAME_PRUNE = now + _TIME_CACHE_SEC
+                for host, expiry in list(_HOSTNAME_CACHE.items()):
+                    if now >= expiry:
+                        _HOSTNAME_CACHE.pop(host, None)
+
     if FLAG_DB:
         with database.connection_context():
-            return _have_hostname_db(link)
-    return _have_hostname_redis(link)
+            flag, timestamp = _have_hostname_db(link)
+    else:
+        flag, timestamp = _have_hostname_redis(link)
+
+    _HOSTNAME_CACHE[link.host] = math.inf if _TIME_CACHE_SEC is None else timestamp + _TIME_CACHE_SEC
+    return flag
 
 
-def _have_hostname_db(link: Link) -> bool:
+def _have_hostname_db(link: Link) -> typing.Tuple[bool, float]:
     """Check if current link is a new host.
 
     The function checks the :class:`~darc.models.tasks.hostname.HostnameQueueModel` table.
@@ -192,24 +618,59 @@ def _have_hostname_db(link: Link) -> bool:
         link: Link to check against.
 
     Returns:
-        If such link is a new host.
+        A tuple of two elements: if such link is a new host, and the
+        timestamp when the host was first seen.
+
+    Note:
+        Known hostnames are checked in one ``SELECT`` statement; new
+        hostnames are then recorded through ``INSERT`` (ignored on conflict),
+        whose affected rows tell if the hostname is recorded by others in
+        the meanwhile. Hostnames first seen earlier than :data:`~darc.const.TIME_CACHE`
+        are considered new again, and their timestamps will be renewed.
 
     """
     timestamp = datetime.datetime.now()
-    if TIME_CACHE is None:
-        threshold = -1
-    else:
-        threshold = timestamp - TIME_CACHE
+    host_hash = _hash_host(link)
+
+    model: typing.Optional[HostnameQueueModel] = HostnameQueueModel.get_or_none(HostnameQueueModel.hash == host_hash)
+    if model is None:
+        query = (HostnameQueueModel
+                 .insert(hostname=link.host,
+                         hash=host_hash,
+                         timestamp=timestamp)
+                 .on_conflict_ignore())
+        if database.execute(query).rowcount:
+            return False, timestamp.timestamp()
+        # recorded by others in the meanwhile
+        return True, timestamp.timestamp()
+
+    if TIME_CACHE is None or model.timestamp > timestamp - TIME_CACHE:
+        return True, model.timestamp.timestamp()
+
+    # renew expired hostname, unless already renewed by others
+    renewed = (HostnameQueueModel
+               .update(timestamp=timestamp)
+               .where((HostnameQueueModel.hash == host_hash)
+                      & (HostnameQueueModel.timestamp == model.timestamp))
+               .execute())
+    return not renewed, timestamp.timestamp()
+
+
+def _hash_host(link: Link) -> str:
+    """Hash hostname of link.
+
+    Args:
+        link: Link to be hashed.
+
+    Returns:
+        The sha256 hash value of the hostname, c.f.
+        :attr:`HostnameQueueModel.hash <darc.model.tasks.hostname.HostnameQueueModel.hash>`.
 
-    model, created = HostnameQueueModel.get_or_create(hostname=link.host, defaults=dict(
-        timestamp=timestamp,
-    ))
-    if created:
-        return False
-    return model.timestamp > threshold
+    """
+    return hashlib.sha256(str(link.host).encode()).hexdigest()
 
 
-def _have_hostname_redis(link: Link) -> bool:
+def _have_hostname_redis(link: Link) -> typing.Tuple[bool, float]:
     """Check if current link is a new host.
 
     The function checks the ``queue_hostname`` database.
@@ -218,13 +679,26 @@ def _have_hostname_redis(link: Link) -> bool:
         link: Link to check against.
 
     Returns:
-        If such link is a new host.
+        A tuple of two elements: if such link is a new host, and the
+        timestamp when the host was first seen.
+
+    Note:
+        The hostname is checked and recorded atomically through the Lua
+        script :data:`~darc.db._HOSTNAME_SCRIPT`. Hostnames first seen
+        earlier than :data:`~darc.const.TIME_CACHE` are considered new
+        again, and will be purged from the database.
 
     """
-    with _redis_get_lock('lock_queue_hostname'):
-        code = _redis_command('sadd', 'queue_hostname', link.host)
-    flag = not bool(code)  # 1 - success; 0 - failed
-    return flag
+    global _HOSTNAME_SCRIPT_OBJ
+
+    if _HOSTNAME_SCRIPT_OBJ is None:
+        _HOSTNAME_SCRIPT_OBJ = redis.register_script(_HOSTNAME_SCRIPT)
+
+    now = time.time()
+    threshold = '' if _TIME_CACHE_SEC is None else now - _TIME_CACHE_SEC
+    code, timestamp = _redis_command(_HOSTNAME_SCRIPT_OBJ, keys=['queue_hostname'], args=[link.host, now, threshold])
+    flag = bool(code)  # 1 - known; 0 - new
+    return flag, float(timestamp)
 
 
 def drop_hostname(link: Link):
@@ -238,6 +712,8 @@ def drop_hostname(link: Link):
         * :func:`darc.db._drop_hostname_redis`
 
     """
+    _HOSTNAME_CACHE.pop(link.host, None)
+
     if FLAG_DB:
         with database.connection_context():
             return _drop_hostname_db(link)
@@ -253,10 +729,10 @@ def _drop_hostname_db(link: Link):
         link: Link to be removed.
 
     """
-    model: HostnameQueueModel = HostnameQueueModel.get_or_none(HostnameQueueModel.hostname == link.host)
-    if model is None:
-        return
-    model.delete_instance()
+    (HostnameQueueModel
+     .delete()
+     .where(HostnameQueueModel.hash == _hash_host(link))
+     .execute())
 
 
 def _drop_hostname_redis(link: Link):
@@ -268,8 +744,7 @@ def _drop_hostname_redis(link: Link):
         link: Link to be removed.
 
     """
-    with _redis_get_lock('lock_queue_hostname'):
-        _redis_command('srem', 'queue_hostname', link.host)
+    _redis_command('zrem', 'queue_hostname', link.host)
 
 
 def drop_requests(link: Link):
@@ -298,10 +773,10 @@ def _drop_requests_db(link: Link):
         link: Link to be removed.
 
     """
-    model: RequestsQueueModel = RequestsQueueModel.get_or_none(RequestsQueueModel.text == link.url)
-    if model is None:
-        return
-    model.delete_instance()
+    (RequestsQueueModel
+     .delete()
+     .where(RequestsQueueModel.hash == link.name)
+     .execute())
 
 
 def _drop_requests_redis(link: Link):
@@ -313,8 +788,13 @@ def _drop_requests_redis(link: Link):
         link: Link to be removed.
 
     """
-    with _redis_get_lock('lock_queue_requests'):
-        _redis_command('zrem', 'queue_requests', pickle.dumps(link))
+    if _dump_host(link) is None:
+        _redis_command('zrem', 'queue_requests', _dump_link(link))
+    else:
+        _redis_pipeline([
+            ('zrem', ('queue_requests', _dump_link(link)), dict()),
+            ('hdel', ('queue_requests_host', link.url), dict()),
+        ])
 
 
 def drop_selenium(link: Link):
@@ -343,10 +823,10 @@ def _drop_selenium_db(link: Link):
         link: Link to be removed.
 
     """
-    model: SeleniumQueueModel = SeleniumQueueModel.get_or_none(SeleniumQueueModel.text == link.url)
-    if model is None:
-        return
-    model.delete_instance()
+    (SeleniumQueueModel
+     .delete()
+     .where(SeleniumQueueModel.hash == link.name)
+     .execute())
 
 
 def _drop_selenium_redis(link: Link):
@@ -358,8 +838,13 @@ def _drop_selenium_redis(link: Link):
         link: Link to be removed.
 
     """
-    with _redis_get_lock('lock_queue_selenium'):
-        _redis_command('zrem', 'queue_selenium', pickle.dumps(link))
+    if _dump_host(link) is None:
+        _redis_command('zrem', 'queue_selenium', _dump_link(link))
+    else:
+        _redis_pipeline([
+            ('zrem', ('queue_selenium', _dump_link(link)), dict()),
+            ('hdel', ('queue_selenium_host', link.url), dict()),
+        ])
 
 
 def save_requests(entries: typing.List[Link], single: bool = False,
@@ -381,18 +866,27 @@ def save_requests(entries: typing.List[Link], single: bool = False,
             already exist. New elements will not be added.
 
     Notes:
-        The ``entries`` will be dumped through :mod:`pickle` so that
-        :mod:`darc` do not need to parse them again.
+        For the RDS backend, the ``entries`` will be dumped through
+        :mod:`pickle` so that :mod:`darc` do not need to parse them again;
+        for the Redis backend, they will be stored by their URLs
+        (c.f. :func:`~darc.db._dump_link`), with overridden hostnames
+        kept in the host hash of the task queue (c.f. :func:`~darc.db._redis_save`).
 
     When ``entries`` is a list of :class:`~darc.link.Link` instances,
     we tries to perform *bulk* update to easy the memory consumption.
     The *bulk* size is defined by :data:`~darc.db.BULK_SIZE`.
 
+    Links saved with ``nx`` will be filtered through :func:`~darc.db._filter_seen`
+    first, so that duplicated links will not reach the database at all.
+
     See Also:
         * :func:`darc.db._save_requests_db`
         * :func:`darc.db._save_requests_redis`
 
     """
+    if nx and not single:
+        entries = _filter_seen('queue_requests', entries)
+
     if FLAG_DB:
         with database.connection_context():
             return _save_requests_db(entries, single, score, nx, xx)
@@ -426,54 +920,58 @@ def _save_requests_db(entries: typing.List[Link], single: bool = False,
     if not single:
         if nx:
             with database.atomic():
-                insert_many = [dict(
+                insert_many = (dict(
                     text=link.url,
                     hash=link.name,
                     link=link,
                     timestamp=score,
-                ) for link in entries]
+                ) for link in entries)
                 for batch in peewee.chunked(insert_many, BULK_SIZE):
                     (RequestsQueueModel
-                     .insert_many(insert_many)
+                     .insert_many(batch)
                      .on_conflict_ignore()
                      .execute())
             return
 
         if xx:
-            entries_text = [link.url for link in entries]
-            (RequestsQueueModel
-             .update(timestamp=score)
-             .where(RequestsQueueModel.text.in_(entries_text))
-             .execute())
+            with database.atomic():
+                for batch in peewee.chunked((link.name for link in entries), BULK_SIZE):
+                    (RequestsQueueModel
+                     .update(timestamp=score)
+                     .where(RequestsQueueModel.hash.in_(batch))
+                     .execute())
             return
 
         with database.atomic():
-            replace_many = [dict(
+            upsert_many = {link.name: dict(
                 text=link.url,
                 hash=link.name,
                 link=link,
                 timestamp=score
-            ) for link in entries]
-            for batch in peewee.chunked(replace_many, BULK_SIZE):
-                RequestsQueueModel.replace_many(batch).execute()
+            ) for link in entries}
+            for batch in peewee.chunked(upsert_many.values(), BULK_SIZE):
+                (RequestsQueueModel
+                 .insert_many(batch)
+                 .on_conflict(conflict_target=_conflict_target(RequestsQueueModel.hash),
+                              preserve=[RequestsQueueModel.text, RequestsQueueModel.link, RequestsQueueModel.timestamp])
+                 .execute())
         return
 
     if nx:
-        RequestsQueueModel.get_or_create(
-            text=entries.url,
-            defaults=dict(
-                hash=entries.name,
-                link=entries,
-                timestamp=score,
-            )
-        )
+        (RequestsQueueModel
+         .insert(text=entries.url,
+                 hash=entries.name,
+                 link=entries,
+                 timestamp=score)
+         .on_conflict_ignore()
+         .execute())
         return
 
     if xx:
-        with contextlib.suppress(peewee.DoesNotExist):
-            model = RequestsQueueModel.get(RequestsQueueModel.text == entries.url)
-            model.timestamp = score
-            model.save()
+        (RequestsQueueModel
+         .update(timestamp=score)
+         .where(RequestsQueueModel.hash == entries.name)
+         .execute())
         return
 
     RequestsQueueModel.replace(
@@ -503,23 +1001,23 @@ def _save_requests_redis(entries: typing.List[Link], single: bool = False,
             already exist. New elements will not be added.
 
     """
+    if not entries:
+        return
     if score is None:
         score = time.time()
 
     if not single:
-        for i in range(0, len(entries), BULK_SIZE):
-            mapping = {
-                pickle.dumps(link): score for link in entries[i:i + BULK_SIZE]
-            }
-            with _redis_get_lock('lock_queue_requests'):
-                _redis_command('zadd', 'queue_requests', mapping, nx=nx, xx=xx)
+        commands = _redis_save('queue_requests', entries, score, nx=nx, xx=xx)
+        with _redis_get_lock('lock_queue_requests'):
+            _redis_pipeline(commands)
         return
 
-    mapping = {
-        pickle.dumps(entries): score,
-    }
-    with _redis_get_lock('lock_queue_requests'):
-        _redis_command('zadd', 'queue_requests', mapping, nx=nx, xx=xx)
+    commands = _redis_save('queue_requests', [entries], score, nx=nx, xx=xx)
+    if len(commands) == 1:
+        command, args, kwargs = commands[0]
+        _redis_command(command, *args, **kwargs)
+    else:
+        _redis_pipeline(commands)
 
 
 def save_selenium(entries: typing.List[Link], single: bool = False,
@@ -539,18 +1037,27 @@ def save_selenium(entries: typing.List[Link], single: bool = False,
             already exist. New elements will not be added.
 
     Notes:
-        The ``entries`` will be dumped through :mod:`pickle` so that
-        :mod:`darc` do not need to parse them again.
+        For the RDS backend, the ``entries`` will be dumped through
+        :mod:`pickle` so that :mod:`darc` do not need to parse them again;
+        for the Redis backend, they will be stored by their URLs
+        (c.f. :func:`~darc.db._dump_link`), with overridden hostnames
+        kept in the host hash of the task queue (c.f. :func:`~darc.db._redis_save`).
 
     When ``entries`` is a list of :class:`~darc.link.Link` instances,
     we tries to perform *bulk* update to easy the memory consumption.
     The *bulk* size is defined by :data:`~darc.db.BULK_SIZE`.
 
+    Links saved with ``nx`` will be filtered through :func:`~darc.db._filter_seen`
+    first, so that duplicated links will not reach the database at all.
+
     See Also:
         * :func:`darc.db._save_selenium_db`
         * :func:`darc.db._save_selenium_redis`
 
     """
+    if nx and not single:
+        entries = _filter_seen('queue_selenium', entries)
+
     if FLAG_DB:
         with database.connection_context():
             return _save_selenium_db(entries, single, score, nx, xx)
@@ -584,54 +1091,58 @@ def _save_selenium_db(entries: typing.List[Link], single: bool = False,
     if not single:
         if nx:
             with database.atomic():
-                insert_many = [dict(
+                insert_many = (dict(
                     text=link.url,
                     hash=link.name,
                     link=link,
                     timestamp=score,
-                ) for link in entries]
+                ) for link in entries)
                 for batch in peewee.chunked(insert_many, BULK_SIZE):
                     (SeleniumQueueModel
-                     .insert_many(insert_many)
+                     .insert_many(batch)
                      .on_conflict_ignore()
                      .execute())
             return
 
         if xx:
-            entries_text = [link.url for link in entries]
-            (SeleniumQueueModel
-             .update(timestamp=score)
-             .where(SeleniumQueueModel.text.in_(entries_text))
-             .execute())
+            with database.atomic():
+                for batch in peewee.chunked((link.name for link in entries), BULK_SIZE):
+                    (SeleniumQueueModel
+                     .update(timestamp=score)
+                     .where(SeleniumQueueModel.hash.in_(batch))
+                     .execute())
             return
 
         with database.atomic():
-            replace_many = [dict(
+            upsert_many = {link.name: dict(
                 text=link.url,
                 hash=link.name,
                 link=link,
                 timestamp=score
-            ) for link in entries]
-            for batch in peewee.chunked(replace_many, BULK_SIZE):
-                SeleniumQueueModel.replace_many(batch).execute()
+            ) for link in entries}
+            for batch in peewee.chunked(upsert_many.values(), BULK_SIZE):
+                (SeleniumQueueModel
+                 .insert_many(batch)
+                 .on_conflict(conflict_target=_conflict_target(SeleniumQueueModel.hash),
+                              preserve=[SeleniumQueueModel.text, SeleniumQueueModel.link, SeleniumQueueModel.timestamp])
+                 .execute())
         return
 
     if nx:
-        SeleniumQueueModel.get_or_create(
-            text=entries.url,
-            defaults=dict(
-                hash=entries.name,
-                link=entries,
-                timestamp=score,
-            )
-        )
+        (SeleniumQueueModel
+         .insert(text=entries.url,
+                 hash=entries.name,
+                 link=entries,
+                 timestamp=score)
+         .on_conflict_ignore()
+         .execute())
         return
 
     if xx:
-        with contextlib.suppress(peewee.DoesNotExist):
-            model = SeleniumQueueModel.get(SeleniumQueueModel.text == entries.url)
-            model.timestamp = score
-            model.save()
+        (SeleniumQueueModel
+         .update(timestamp=score)
+         .where(SeleniumQueueModel.hash == entries.name)
+         .execute())
         return
 
     SeleniumQueueModel.replace(
@@ -665,8 +1176,8 @@ def _save_selenium_redis(entries: typing.List[Link], single: bool = False,
     The *bulk* size is defined by :data:`~darc.db.BULK_SIZE`.
 
     Notes:
-        The ``entries`` will be dumped through :mod:`pickle` so that
-        :mod:`darc` do not need to parse them again.
+        The ``entries`` will be dumped through :func:`~darc.db._dump_link`,
+        i.e. stored by their URLs.
 
     """
     if not entries:
@@ -675,19 +1186,17 @@ def _save_selenium_redis(entries: typing.List[Link], single: bool = False,
         score = time.time()
 
     if not single:
-        for i in range(0, len(entries), BULK_SIZE):
-            mapping = {
-                pickle.dumps(link): score for link in entries[i:i + BULK_SIZE]
-            }
-            with _redis_get_lock('lock_queue_selenium'):
-                _redis_command('zadd', 'queue_selenium', mapping, nx=nx, xx=xx)
+        commands = _redis_save('queue_selenium', entries, score, nx=nx, xx=xx)
+        with _redis_get_lock('lock_queue_selenium'):
+            _redis_pipeline(commands)
         return
 
-    mapping = {
-        pickle.dumps(entries): score,
-    }
-    with _redis_get_lock('lock_queue_selenium'):
-        _redis_command('zadd', 'queue_selenium', mapping, nx=nx, xx=xx)
+    commands = _redis_save('queue_selenium', [entries], score, nx=nx, xx=xx)
+    if len(commands) == 1:
+        command, args, kwargs = commands[0]
+        _redis_command(command, *args, **kwargs)
+    else:
+        _redis_pipeline(commands)
 
 
 def load_requests(check: bool = CHECK) -> typing.List[Link]:
@@ -718,13 +1227,13 @@ def load_requests(check: bool = CHECK) -> typing.List[Link]:
     if check:
         link_pool = _check(link_pool)
 
-    if VERBOSE:
-        print(stem.util.term.format('-*- [REQUESTS] LINK POOL -*-',
-                                    stem.util.term.Color.MAGENTA))  # pylint: disable=no-member
-        print(render_error(pprint.pformat(sorted(link.url for link in link_pool)),
+    if VERBOSE and link_pool:
+        url_list = [link.url for link in link_pool]
+        url_list.sort()
+        print(_REQUESTS_HEADER)
+        print(render_error('\n'.join(url_list),
                            stem.util.term.Color.MAGENTA))  # pylint: disable=no-member
-        print(stem.util.term.format('-' * shutil.get_terminal_size().columns,
-                                    stem.util.term.Color.MAGENTA))  # pylint: disable=no-member
+        print(_POOL_SEPARATOR)
     return link_pool
 
 
@@ -752,16 +1261,24 @@ def _load_requests_db() -> typing.List[Link]:
     with database.atomic():
         query: typing.List[RequestsQueueModel] = (
             RequestsQueueModel
-            .select(RequestsQueueModel.link)
+            .select(RequestsQueueModel.id, RequestsQueueModel.link)
             .where(RequestsQueueModel.timestamp <= max_score)
             .order_by(RequestsQueueModel.timestamp)
             .limit(MAX_POOL)
         )
-        link_pool = [model.link for model in query]
+        id_list = list()
+        link_pool = list()
+        for model in query.iterator():
+            id_list.append(model.id)
+            link_pool.append(model.link)
 
-        if TIME_CACHE is not None:
+        if TIME_CACHE is not None and id_list:
             new_score = now + sec_delta
-            _save_requests_db(link_pool, score=new_score)  # force update records
+            # force update records by primary keys
+            (RequestsQueueModel
+             .update(timestamp=new_score)
+             .where(RequestsQueueModel.id.in_(id_list))
+             .execute())
     return link_pool
 
 
@@ -777,28 +1294,14 @@ def _load_requests_redis() -> typing.List[Link]:
         At runtime, the function will load links with maximum number
         at :data:`~darc.db.MAX_POOL` to limit the memory usage.
 
+    See Also:
+        * :func:`darc.db._redis_load`
+
     """
     now = time.time()
-    if TIME_CACHE is None:
-        sec_delta = 0
-        max_score = now
-    else:
-        sec_delta = TIME_CACHE.total_seconds()
-        max_score = now - sec_delta
-
-    try:
-        with _redis_get_lock('lock_queue_requests', blocking_timeout=LOCK_TIMEOUT):
-            link_pool = [pickle.loads(link) for link in _redis_command('zrangebyscore', 'queue_requests',
-                                                                       min=0, max=max_score, start=0, num=MAX_POOL)]
-            if TIME_CACHE is not None:
-                new_score = now + sec_delta
-                _save_requests_redis(link_pool, score=new_score)  # force update records
-    except redis_lock.LockError:
-        warning = warnings.formatwarning(f'[REQUESTS] Failed to acquire Redis lock after {LOCK_TIMEOUT} second(s)',
-                                         LockWarning, __file__, 250, "_redis_get_lock('lock_queue_requests')")
-        print(render_error(warning, stem.util.term.Color.YELLOW), end='', file=sys.stderr)  # pylint: disable=no-member
-        link_pool = list()
-    return link_pool
+    if _TIME_CACHE_SEC is None:
+        return _redis_load('queue_requests', max_score=now)
+    return _redis_load('queue_requests', max_score=now - _TIME_CACHE_SEC, new_score=now + _TIME_CACHE_SEC)
 
 
 def load_selenium(check: bool = CHECK) -> typing.List[Link]:
@@ -829,13 +1332,13 @@ def load_selenium(check: bool = CHECK) -> typing.List[Link]:
     if check:
         link_pool = _check(link_pool)
 
-    if VERBOSE:
-        print(stem.util.term.format('-*- [SELENIUM] LINK POOL -*-',
-                                    stem.util.term.Color.MAGENTA))  # pylint: disable=no-member
-        print(render_error(pprint.pformat(sorted(link.url for link in link_pool)),
+    if VERBOSE and link_pool:
+        url_list = [link.url for link in link_pool]
+        url_list.sort()
+        print(_SELENIUM_HEADER)
+        print(render_error('\n'.join(url_list),
                            stem.util.term.Color.MAGENTA))  # pylint: disable=no-member
-        print(stem.util.term.format('-' * shutil.get_terminal_size().columns,
-                                    stem.util.term.Color.MAGENTA))  # pylint: disable=no-member
+        print(_POOL_SEPARATOR)
     return link_pool
 
 
@@ -863,16 +1366,24 @@ def _load_selenium_db() -> typing.List[Link]:
     with database.atomic():
         query: typing.List[SeleniumQueueModel] = (
             SeleniumQueueModel
-            .select(SeleniumQueueModel.link)
+            .select(SeleniumQueueModel.id, SeleniumQueueModel.link)
             .where(SeleniumQueueModel.timestamp <= max_score)
             .order_by(SeleniumQueueModel.timestamp)
             .limit(MAX_POOL)
         )
-        link_pool = [model.link for model in query]
+        id_list = list()
+        link_pool = list()
+        for model in query.iterator():
+            id_list.append(model.id)
+            link_pool.append(model.link)
 
-        if TIME_CACHE is not None:
+        if TIME_CACHE is not None and id_list:
             new_score = now + sec_delta
-            _save_selenium_db(link_pool, score=new_score)  # force update records
+            # force update records by primary keys
+            (SeleniumQueueModel
+             .update(timestamp=new_score)
+             .where(SeleniumQueueModel.id.in_(id_list))
+             .execute())
     return link_pool
 
 
@@ -892,25 +1403,11 @@ def _load_selenium_redis() -> typing.List[Link]:
         At runtime, the function will load links with maximum number
         at :data:`~darc.db.MAX_POOL` to limit the memory usage.
 
+    See Also:
+        * :func:`darc.db._redis_load`
+
     """
     now = time.time()
-    if TIME_CACHE is None:
-        sec_delta = 0
-        max_score = now
-    else:
-        sec_delta = TIME_CACHE.total_seconds()
-        max_score = now - sec_delta
-
-    try:
-        with _redis_get_lock('lock_queue_selenium', blocking_timeout=LOCK_TIMEOUT):
-            link_pool = [pickle.loads(link) for link in _redis_command('zrangebyscore', 'queue_selenium',
-                                                                       min=0, max=max_score, start=0, num=MAX_POOL)]
-            if TIME_CACHE is not None:
-                new_score = now + sec_delta
-                _save_selenium_redis(link_pool, score=new_score)  # force update records
-    except redis_lock.LockError:
-        warning = warnings.formatwarning(f'[SELENIUM] Failed to acquire Redis lock after {LOCK_TIMEOUT} second(s)',
-                                         LockWarning, __file__, 299, "_redis_get_lock('lock_queue_selenium')")
-        print(render_error(warning, stem.util.term.Color.YELLOW), end='', file=sys.stderr)  # pylint: disable=no-member
-        link_pool = list()
-    return link_pool
+    if _TIME_CACHE_SEC is None:
+        return _redis_load('queue_selenium', max_score=now)
+    return _redis_load('queue_selenium', max_score=now - _TIME_CACHE_SEC, new_score=now + _TIME_CACHE_SEC)
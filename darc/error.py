@@ -26,6 +26,8 @@ The :mod:`darc` project provides following custom exceptions:
 
 """
 
+import functools
+
 import stem.util.term
 
 import darc.typing as typing
@@ -98,6 +100,24 @@ def render_error(message: str, colour: typing.Color) -> str:
         The rendered error message.
 
     """
+    prefix, suffix = colour_codes(colour)
     return ''.join(
-        stem.util.term.format(line, colour) for line in message.splitlines(True)
+        f'{prefix}{line}{suffix}' for line in message.splitlines(True)
     )
+
+
+@functools.lru_cache(maxsize=None)
+def colour_codes(colour: typing.Color) -> typing.Tuple[str, str]:
+    """Get ANSI escape sequences of colour.
+
+    Args:
+        colour (stem.util.term.Color): Front colour of text, c.f.
+            :class:`stem.util.term.Color`.
+
+    Returns:
+        The prefix and suffix escape sequences rendered by
+        :func:`stem.util.term.format` around a text.
+
+    """
+    prefix, suffix = stem.util.term.format('{}', colour).split('{}')
+    return prefix, suffix
@@ -29,6 +29,9 @@ try:
 except NotImplementedError:
     from pathlib import PurePosixPath as PosixPath
 
+# Tor & I2P link regular expression, dispatched by group name
+_PROXY_REGEX = re.compile(r'.*\.(?:(?P<tor>onion)|(?P<i2p>i2p))')
+
 
 def quote(string: typing.AnyStr, safe: typing.AnyStr = '/',
           encoding: typing.Optional[str] = None, errors: typing.Optional[str] = None) -> str:
@@ -178,6 +181,42 @@ class Link:
         raise TypeError(f"'<' not supported between instances of 'Link' and {type(value).__name__!r}")
 
 
+@functools.lru_cache(maxsize=4096)
+def _proxy_by_host(host: str) -> str:
+    """Get proxy type by hostname.
+
+    Args:
+        host: hostname of the link
+
+    Returns:
+        The proxy type of ``host``.
+
+    Note:
+        The function is cached through :func:`functools.lru_cache`,
+        as the proxy type only depends on the hostname and the same
+        hosts will be encountered repeatedly when crawling.
+
+        For ZeroNet and Freenet addresses, the root path shall be
+        further checked by the caller, c.f. :func:`~darc.link.parse_link`.
+
+    """
+    from darc.proxy.freenet import FREENET_PORT  # pylint: disable=import-outside-toplevel
+    from darc.proxy.zeronet import ZERONET_PORT  # pylint: disable=import-outside-toplevel
+
+    match = _PROXY_REGEX.fullmatch(host)
+    if match is not None:
+        return match.lastgroup
+    if host in ['127.0.0.1:7657', '127.0.0.1:7658',
+                'localhost:7657', 'localhost:7658']:
+        # c.f. https://geti2p.net/en/docs/api/i2ptunnel
+        return 'i2p'
+    if host in (f'127.0.0.1:{ZERONET_PORT}', f'localhost:{ZERONET_PORT}'):
+        return 'zeronet'
+    if host in (f'127.0.0.1:{FREENET_PORT}', f'localhost:{FREENET_PORT}'):
+        return 'freenet'
+    return 'null'
+
+
 def parse_link(link: str, host: typing.Optional[str] = None) -> Link:
     """Parse link.
 
@@ -257,9 +296,6 @@ def parse_link(link: str, host: typing.Optional[str] = None) -> Link:
     the sha256 hash (c.f. :func:`hashlib.sha256`) of the original ``link``.
 
     """
-    from darc.proxy.freenet import FREENET_PORT  # pylint: disable=import-outside-toplevel
-    from darc.proxy.zeronet import ZERONET_PORT  # pylint: disable=import-outside-toplevel
-
     # <scheme>://<netloc>/<path>;<params>?<query>#<fragment>
     parse = urlparse(link)
     if host is None:
@@ -300,31 +336,15 @@ def parse_link(link: str, host: typing.Optional[str] = None) -> Link:
     elif host is None:
         hostname = '(null)'
         proxy_type = 'null'
-    elif re.fullmatch(r'.*?\.onion', host):
-        proxy_type = 'tor'
-    elif re.fullmatch(r'.*?\.i2p', host):
-        proxy_type = 'i2p'
-    elif host in ['127.0.0.1:7657', '127.0.0.1:7658',
-                  'localhost:7657', 'localhost:7658']:
-        # c.f. https://geti2p.net/en/docs/api/i2ptunnel
-        proxy_type = 'i2p'
-    elif host in (f'127.0.0.1:{ZERONET_PORT}', f'localhost:{ZERONET_PORT}'):
-        # not for root path
-        if parse.path in ['', '/']:
-            proxy_type = 'null'
-        else:
-            proxy_type = 'zeronet'
-            hostname = PosixPath(parse.path).parts[1]
-    elif host in (f'127.0.0.1:{FREENET_PORT}', f'localhost:{FREENET_PORT}'):
-        # not for root path
-        if parse.path in ['', '/']:
-            proxy_type = 'null'
-        else:
-            proxy_type = 'freenet'
-            hostname = PosixPath(parse.path).parts[1]
-    # fallback
     else:
-        proxy_type = 'null'
+        proxy_type = _proxy_by_host(host)
+
+        # not for root path
+        if proxy_type in ['zeronet', 'freenet']:
+            if parse.path in ['', '/']:
+                proxy_type = 'null'
+            else:
+                hostname = PosixPath(parse.path).parts[1]
 
     # <proxy>/<scheme>/<host>/<hash>-<timestamp>.html
     base = os.path.join(PATH_DB, proxy_type, scheme, hostname)
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""Logging Wrapper
+=====================
+
+The :mod:`darc.logging` module wraps around the :mod:`logging`
+module, and provides the logger for the :mod:`darc` project.
+
+By default, the :data:`~darc.logging.logger` writes records
+directly to :data:`sys.stdout` (for records below ``WARNING``)
+and :data:`sys.stderr`. Once :func:`~darc.logging.start_listener`
+is called, the records will be put into :data:`~darc.logging.LOG_QUEUE`
+through :class:`~darc.logging.QueueHandler` instead, and a single
+:class:`logging.handlers.QueueListener` thread will format and
+write them out, so that workers do not contend on the standard
+streams.
+
+"""
+
+import logging
+import logging.handlers
+import multiprocessing
+import queue
+import shutil
+import sys
+
+import stem.util.term
+
+import darc.typing as typing
+from darc.const import DEBUG, FLAG_MP
+from darc.error import colour_codes
+
+# separator line for tracebacks
+_SEPARATOR = '-' * shutil.get_terminal_size().columns
+
+#: Union[multiprocessing.Queue, queue.Queue]: Queue of log records
+#: consumed by the :class:`logging.handlers.QueueListener`.
+LOG_QUEUE = multiprocessing.Queue() if FLAG_MP else queue.Queue()
+
+#: Optional[logging.handlers.QueueListener]: Active queue listener.
+_LISTENER = None
+
+
+class ColourFormatter(logging.Formatter):
+    """Formatter with :mod:`stem.util.term` colours.
+
+    Records with traceback are rendered in cyan and followed
+    by a separator line; others are rendered by their levels
+    as defined in :attr:`~darc.logging.ColourFormatter.COLOUR_MAP`.
+
+    """
+
+    #: Dict[int, stem.util.term.Color]: Colour of logging levels.
+    COLOUR_MAP = {
+        logging.WARNING: stem.util.term.Color.YELLOW,  # pylint: disable=no-member
+        logging.ERROR: stem.util.term.Color.RED,  # pylint: disable=no-member
+        logging.CRITICAL: stem.util.term.Color.RED,  # pylint: disable=no-member
+    }
+
+    #: Dict[int, Tuple[str, str]]: ANSI escape sequences of logging levels,
+    #: precomputed from :attr:`~darc.logging.ColourFormatter.COLOUR_MAP`.
+    CODES_MAP = {level: colour_codes(colour) for level, colour in COLOUR_MAP.items()}
+
+    #: Tuple[str, str]: ANSI escape sequences of records with traceback.
+    TRACEBACK_CODES = colour_codes(stem.util.term.Color.CYAN)  # pylint: disable=no-member
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the specified record.
+
+        Args:
+            record: Log record to be formatted.
+
+        Returns:
+            The formatted and rendered message.
+
+        """
+        message = super().format(record)
+        if record.exc_info or getattr(record, 'has_traceback', False):
+            codes = self.TRACEBACK_CODES
+            message = f'{message}\n{_SEPARATOR}'
+        else:
+            codes = self.CODES_MAP.get(record.levelno)
+            if codes is None:
+                return message
+
+        prefix, suffix = codes
+        return ''.join(f'{prefix}{line}{suffix}' for line in message.splitlines(True))
+
+
+class QueueHandler(logging.handlers.QueueHandler):
+    """Queue handler keeping the traceback flag of records.
+
+    As :meth:`logging.handlers.QueueHandler.prepare` merges and
+    strips the exception information, the handler marks records
+    with traceback through the ``has_traceback`` attribute, so that
+    :class:`~darc.logging.ColourFormatter` can still render them.
+
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Prepare a record for queuing.
+
+        Args:
+            record: Log record to be queued.
+
+        Returns:
+            The prepared log record.
+
+        """
+        record.has_traceback = record.exc_info is not None
+        return super().prepare(record)
+
+
+def get_handlers() -> typing.List[logging.Handler]:
+    """Generate stream handlers.
+
+    Returns:
+        A handler writing records below ``WARNING`` to :data:`sys.stdout`,
+        and a handler writing the rest to :data:`sys.stderr`, both formatted
+        through :class:`~darc.logging.ColourFormatter`.
+
+    """
+    stdout = logging.StreamHandler(sys.stdout)
+    stdout.addFilter(lambda record: record.levelno < logging.WARNING)
+
+    stderr = logging.StreamHandler(sys.stderr)
+    stderr.setLevel(logging.WARNING)
+
+    handlers = [stdout, stderr]
+    for handler in handlers:
+        handler.setFormatter(ColourFormatter())
+    return handlers
+
+
+def start_listener():
+    """Start the queue listener.
+
+    The function moves the stream handlers of :data:`~darc.logging.logger`
+    to a :class:`logging.handlers.QueueListener` on :data:`~darc.logging.LOG_QUEUE`,
+    and replaces them with a :class:`~darc.logging.QueueHandler`.
+
+    Note:
+        The function should be called in the main process before starting
+        the workers, so that the workers inherit the queue handler.
+
+    """
+    global _LISTENER
+
+    if _LISTENER is not None:
+        return
+
+    handlers = list(logger.handlers)
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(LOG_QUEUE))
+
+    _LISTENER = logging.handlers.QueueListener(LOG_QUEUE, *handlers, respect_handler_level=True)
+    _LISTENER.start()
+
+
+def stop_listener():
+    """Stop the queue listener.
+
+    The function flushes the pending records in :data:`~darc.logging.LOG_QUEUE`,
+    and restores the stream handlers of :data:`~darc.logging.logger`.
+
+    """
+    global _LISTENER
+
+    if _LISTENER is None:
+        return
+
+    _LISTENER.stop()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    for handler in _LISTENER.handlers:
+        logger.addHandler(handler)
+    _LISTENER = None
+
+
+#: logging.Logger: Logger of the :mod:`darc` project.
+logger = logging.getLogger('darc')
+logger.setLevel(logging.DEBUG if DEBUG else logging.INFO)
+logger.propagate = False
+for _handler in get_handlers():
+    logger.addHandler(_handler)
+del _handler
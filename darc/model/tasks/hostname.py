@@ -4,8 +4,9 @@
 
 .. important::
 
-   The hostname queue is a **set** named ``queue_hostname`` in
-   a `Redis`_ based task queue.
+   The hostname queue is a **sorted set** named ``queue_hostname`` in
+   a `Redis`_ based task queue, whose scores are the timestamps when
+   the hostnames were first seen.
 
    .. _Redis: https://redis.io
 
@@ -27,5 +28,7 @@ class HostnameQueueModel(BaseModel):
 
     #: Hostname (c.f. :attr:`link.host <darc.link.Link.host>`).
     hostname: typing.Union[str, peewee.TextField] = peewee.TextField()
+    #: Sha256 hash value of the hostname.
+    hash: typing.Union[str, peewee.CharField] = peewee.CharField(max_length=256, unique=True)
     #: Timestamp of last update.
     timestamp: typing.Union[typing.Datetime, peewee.DateTimeField] = peewee.DateTimeField()
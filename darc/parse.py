@@ -151,11 +151,11 @@ def check_robots(link: Link) -> bool:
     return True
 
 
-def _check_ng(temp_list: typing.List[Link]) -> typing.List[Link]:
+def _check_ng(temp_list: typing.Iterable[Link]) -> typing.List[Link]:
     """Check content type of links through ``HEAD`` requests.
 
     Args:
-        temp_list: List of links to be checked.
+        temp_list: Iterable of links to be checked.
 
     Returns:
         List of links matches the requirements.
@@ -211,11 +211,11 @@ def _check_ng(temp_list: typing.List[Link]) -> typing.List[Link]:
     return link_list
 
 
-def _check(temp_list: typing.List[Link]) -> typing.List[Link]:
+def _check(temp_list: typing.Iterable[Link]) -> typing.List[Link]:
     """Check hostname and proxy type of links.
 
     Args:
-        temp_list: List of links to be checked.
+        temp_list: Iterable of links to be checked.
 
     Returns:
         List of links matches the requirements.
@@ -225,6 +225,10 @@ def _check(temp_list: typing.List[Link]) -> typing.List[Link]:
         the function will directly call :func:`~darc.parse._check_ng`
         instead.
 
+        The function checks the links as a batch, i.e. the hostname
+        and proxy type matching are performed once for each distinct
+        pair of hostname and proxy type in ``temp_list``.
+
     See Also:
         * :func:`darc.parse.match_host`
         * :func:`darc.parse.match_proxy`
@@ -234,10 +238,13 @@ def _check(temp_list: typing.List[Link]) -> typing.List[Link]:
         return _check_ng(temp_list)
 
     link_list = list()
+    verdict_map = dict()  # (host, proxy) -> excluded?
     for link in temp_list:
-        if match_host(link.host):
-            continue
-        if match_proxy(link.proxy):
+        key = (link.host, link.proxy)
+        excluded = verdict_map.get(key)
+        if excluded is None:
+            excluded = verdict_map[key] = match_host(link.host) or match_proxy(link.proxy)
+        if excluded:
             continue
         link_list.append(link)
     return link_list
@@ -269,7 +276,7 @@ def get_content_type(response: typing.Response) -> str:
             ct_type = magic.detect_from_content(response.content).mime_type
         except Exception:
             ct_type = '(null)'
-    return ct_type.casefold().split(';', maxsplit=1)[0].strip()
+    return ct_type.partition(';')[0].strip().lower()
 
 
 def extract_links(link: Link, html: typing.Union[str, bytes], check: bool = CHECK) -> typing.List[Link]:
@@ -291,14 +298,12 @@ def extract_links(link: Link, html: typing.Union[str, bytes], check: bool = CHEC
     """
     soup = bs4.BeautifulSoup(html, 'html5lib')
 
-    temp_list = list()
-    for child in soup.find_all(lambda tag: tag.has_attr('href') or tag.has_attr('src')):
-        if (href := child.get('href', child.get('src'))) is None:
-            continue
-        temp_link = parse_link(urljoin(link.url, href))
-        temp_list.append(temp_link)
+    url_list = dict.fromkeys(urljoin(link.url, href)
+                             for child in soup.find_all(lambda tag: tag.has_attr('href') or tag.has_attr('src'))
+                             if (href := child.get('href', child.get('src'))) is not None)
+    temp_list = (parse_link(url) for url in url_list)
 
     # check content / proxy type
     if check:
         return _check(temp_list)
-    return temp_list
+    return list(temp_list)
@@ -7,6 +7,7 @@ logic of the :mod:`darc` module.
 
 """
 
+import concurrent.futures
 import multiprocessing
 import os
 import signal
@@ -20,13 +21,16 @@ import stem.util.term
 
 import darc.typing as typing
 from darc._compat import strsignal
-from darc.const import DARC_CPU, DARC_WAIT, FLAG_MP, FLAG_TH, PATH_ID, REBOOT, getpid
+from darc.const import (DARC_CPU, DARC_THREAD, DARC_WAIT, FLAG_MP, FLAG_TH, PATH_ID, REBOOT,
+                        getpid)
 from darc.crawl import crawler, loader
 from darc.db import load_requests, load_selenium
+from darc.logging import start_listener, stop_listener
 from darc.proxy.freenet import _FREENET_BS_FLAG, freenet_bootstrap
 from darc.proxy.i2p import _I2P_BS_FLAG, i2p_bootstrap
 from darc.proxy.tor import _TOR_BS_FLAG, renew_tor_session, tor_bootstrap
 from darc.proxy.zeronet import _ZERONET_BS_FLAG, zeronet_bootstrap
+from darc.selenium import close_drivers
 
 #: List[Union[multiprocessing.Process, threading.Thread]]: List of
 #: active child processes and/or threads.
@@ -73,55 +77,69 @@ def _signal_handler(signum: typing.Optional[typing.Union[int, signal.Signals]] =
 
 
 def process_crawler():
-    """A worker to run the :func:`~darc.crawl.crawler` process."""
+    """A worker to run the :func:`~darc.crawl.crawler` process.
+
+    The links loaded in each round are crawled concurrently
+    through a thread pool of :data:`~darc.const.DARC_THREAD`
+    threads.
+
+    """
     print('[CRAWLER] Starting first round...')
 
-    # start mainloop
-    while True:
-        # requests crawler
-        link_pool = load_requests()
-        if not link_pool:
-            if DARC_WAIT is not None:
-                time.sleep(DARC_WAIT)
-            continue
+    with concurrent.futures.ThreadPoolExecutor(max_workers=DARC_THREAD) as executor:
+        # start mainloop
+        while True:
+            # requests crawler
+            link_pool = load_requests()
+            if not link_pool:
+                if DARC_WAIT is not None:
+                    time.sleep(DARC_WAIT)
+                continue
 
-        for link in link_pool:
-            crawler(link)
+            concurrent.futures.wait([executor.submit(crawler, link) for link in link_pool])
 
-        # quit in reboot mode
-        if REBOOT:
-            break
+            # quit in reboot mode
+            if REBOOT:
+                break
 
-        # renew Tor session
-        renew_tor_session()
-        print('[CRAWLER] Starting next round...')
+            # renew Tor session
+            renew_tor_session()
+            print('[CRAWLER] Starting next round...')
 
     print('[CRAWLER] Stopping mainloop...')
 
 
 def process_loader():
-    """A worker to run the :func:`~darc.crawl.loader` process."""
-    print('[LOADER] Starting first round...')
-
-    # start mainloop
-    while True:
-        # selenium loader
-        link_pool = load_selenium()
-        if not link_pool:
-            if DARC_WAIT is not None:
-                time.sleep(DARC_WAIT)
-            continue
+    """A worker to run the :func:`~darc.crawl.loader` process.
 
-        for link in link_pool:
-            loader(link)
+    The web drivers are reused across rounds, and will be
+    closed when the worker stops (c.f. :func:`~darc.selenium.close_drivers`).
 
-        # quit in reboot mode
-        if REBOOT:
-            break
+    """
+    print('[LOADER] Starting first round...')
 
-        # renew Tor session
-        renew_tor_session()
-        print('[LOADER] Starting next round...')
+    try:
+        # start mainloop
+        while True:
+            # selenium loader
+            link_pool = load_selenium()
+            if not link_pool:
+                if DARC_WAIT is not None:
+                    time.sleep(DARC_WAIT)
+                continue
+
+            for link in link_pool:
+                loader(link)
+
+            # quit in reboot mode
+            if REBOOT:
+                break
+
+            # renew Tor session
+            renew_tor_session()
+            print('[LOADER] Starting next round...')
+    finally:
+        close_drivers()
 
     print('[LOADER] Stopping mainloop...')
 
@@ -260,6 +278,9 @@ def process(worker: typing.Literal['crawler', 'loader']):
        extract all possible links from the HTML document and save such
        links into the :mod:`requests` database (c.f. :func:`~darc.db.save_requests`).
 
+    Log records from the workers are written out by a single listener
+    thread in the main process, c.f. :func:`~darc.logging.start_listener`.
+
     If in reboot mode, i.e. :data:`~darc.const.REBOOT` is :data:`True`, the function
     will exit after first round. If not, it will renew the Tor connections (if
     bootstrapped), c.f. :func:`~darc.proxy.tor.renew_tor_session`, and start
@@ -272,6 +293,9 @@ def process(worker: typing.Literal['crawler', 'loader']):
 
     print(f'[DARC] Starting {worker}...')
 
+    # start logging listener
+    start_listener()
+
     if not _TOR_BS_FLAG:
         tor_bootstrap()
     if not _I2P_BS_FLAG:
@@ -281,11 +305,14 @@ def process(worker: typing.Literal['crawler', 'loader']):
     if not _FREENET_BS_FLAG:
         freenet_bootstrap()
 
-    if worker == 'crawler':
-        _process(process_crawler)
-    elif worker == 'loader':
-        _process(process_loader)
-    else:
-        raise ValueError(f'invalid worker type: {worker!r}')
+    try:
+        if worker == 'crawler':
+            _process(process_crawler)
+        elif worker == 'loader':
+            _process(process_loader)
+        else:
+            raise ValueError(f'invalid worker type: {worker!r}')
+    finally:
+        stop_listener()
 
     print(f'[DARC] Gracefully existing {worker}...')
@@ -7,10 +7,15 @@ around managing and processing normal websites with no proxy.
 
 """
 
+import concurrent.futures
 import gzip
 import io
+import math
 import os
 import sys
+import threading
+import time
+import xml.etree.ElementTree
 
 import bs4
 import requests
@@ -32,6 +37,21 @@ from darc.save import save_link
 PATH = os.path.join(PATH_MISC, 'invalid.txt')
 LOCK = get_lock()
 
+# robots.txt & sitemaps cache TTL
+ROBOTS_TTL = float(os.getenv('DARC_ROBOTS_TTL', '21600'))
+if not math.isfinite(ROBOTS_TTL):
+    ROBOTS_TTL = None
+
+#: Dict[str, float]: Hosts whose ``robots.txt`` and sitemaps have been
+#: fetched, mapped to the (monotonic) timestamp when fetched.
+_ROBOTS_CACHE = dict()
+#: float: (Monotonic) timestamp of next pruning of :data:`~darc.proxy.null._ROBOTS_CACHE`.
+_ROBOTS_PRUNE = 0.0
+#: Dict[str, concurrent.futures.Future]: Hosts whose ``robots.txt`` and sitemaps
+#: are being fetched, mapped to the future resolved once finished.
+_INFLIGHT = dict()
+_ROBOTS_LOCK = threading.Lock()
+
 
 def save_invalid(link: Link):
     """Save link with invalid scheme.
@@ -163,10 +183,54 @@ def read_robots(link: Link, text: str, host: typing.Optional[str] = None) -> typ
 
     sitemaps = rp.site_maps()
     if sitemaps is None:
-        return [parse_link(urljoin(link.url, '/sitemap.xml'))]
+        return [parse_link(f'{link.url_parse.scheme}://{link.url_parse.netloc}/sitemap.xml')]
     return [parse_link(urljoin(link.url, sitemap), host=host) for sitemap in sitemaps]
 
 
+def _read_loc(text: str, root: str, entry: str) -> typing.List[str]:
+    """Read ``<loc>`` elements from a sitemap.
+
+    Args:
+        text: Content of the sitemap.
+        root: Tag name of the root element, e.g. ``urlset``.
+        entry: Tag name of the entry elements, e.g. ``url``.
+
+    Returns:
+        Text of the ``<root> > <entry> > <loc>`` elements.
+
+    Note:
+        The sitemap is parsed incrementally with :func:`xml.etree.ElementTree.iterparse`,
+        and the parsed elements are released at once, so that the full
+        document tree will not be built. If the sitemap is not well-formed XML,
+        or it contains DTD declarations (whose internal entities would be
+        expanded by :mod:`xml.etree.ElementTree`, e.g. the *billion laughs*
+        attack), the function falls back to :class:`bs4.BeautifulSoup` with
+        ``html5lib``, which never expands entities.
+
+    """
+    if '<!DOCTYPE' not in text and '<!ENTITY' not in text:
+        loc_list = list()
+        try:
+            stack = list()
+            for event, elem in xml.etree.ElementTree.iterparse(io.StringIO(text), events=('start', 'end')):
+                # strip XML namespace
+                tag = elem.tag.rpartition('}')[2]
+                if event == 'start':
+                    stack.append(tag)
+                    continue
+
+                if tag == 'loc' and stack[-3:] == [root, entry, 'loc'] and elem.text is not None:
+                    loc_list.append(elem.text.strip())
+                stack.pop()
+                elem.clear()
+            return loc_list
+        except xml.etree.ElementTree.ParseError:
+            pass
+
+    soup = bs4.BeautifulSoup(text, 'html5lib')
+    return [loc.text for loc in soup.select(f'{root} > {entry} > loc')]
+
+
 def get_sitemap(link: Link, text: str, host: typing.Optional[str] = None) -> typing.List[Link]:
     """Fetch link to other sitemaps from a sitemap.
 
@@ -186,12 +250,8 @@ def get_sitemap(link: Link, text: str, host: typing.Optional[str] = None) -> typ
         .. [*] https://www.sitemaps.org/protocol.html#index
 
     """
-    sitemaps = list()
-    soup = bs4.BeautifulSoup(text, 'html5lib')
-
     # https://www.sitemaps.org/protocol.html#index
-    for loc in soup.select('sitemapindex > sitemap > loc'):
-        sitemaps.append(urljoin(link.url, loc.text))
+    sitemaps = [urljoin(link.url, loc) for loc in _read_loc(text, 'sitemapindex', 'sitemap')]
     return [parse_link(sitemap, host=host) for sitemap in sitemaps]
 
 
@@ -212,15 +272,107 @@ def read_sitemap(link: Link, text: str, check: bool = CHECK) -> typing.List[Link
         * :func:`darc.parse._check_ng`
 
     """
-    soup = bs4.BeautifulSoup(text, 'html5lib')
-
     # https://www.sitemaps.org/protocol.html
-    temp_list = [parse_link(urljoin(link.url, loc.text), host=link.host) for loc in soup.select('urlset > url > loc')]
+    temp_list = (parse_link(urljoin(link.url, loc), host=link.host) for loc in _read_loc(text, 'urlset', 'url'))
 
     # check content / proxy type
     if check:
         return _check(temp_list)
-    return temp_list
+    return list(temp_list)
+
+
+def read_cached_sitemap(link: Link) -> typing.Optional[str]:
+    """Read sitemap from the data storage.
+
+    Args:
+        link: Link object of the sitemap.
+
+    Returns:
+        Content of the sitemap, or :data:`None` if not cached.
+
+    See Also:
+        * :func:`darc.proxy.null.have_sitemap`
+
+    """
+    # <proxy>/<scheme>/<host>/sitemap_<hash>.xml
+    sitemap_path = os.path.join(link.base, f'sitemap_{link.name}.xml')
+    try:
+        with open(sitemap_path) as file:
+            sitemap_text = file.read()
+    except FileNotFoundError:
+        return None
+
+    # strip the URL comment line written by save_sitemap
+    if sitemap_text.startswith('<!--'):
+        sitemap_text = sitemap_text.partition('\n')[2]
+
+    print(stem.util.term.format(f'[SITEMAP] Cached {link.url}',
+                                stem.util.term.Color.YELLOW))  # pylint: disable=no-member
+    return sitemap_text
+
+
+def _list_files(path: str) -> typing.Set[str]:
+    """List files in a directory.
+
+    Args:
+        path: Path to the directory.
+
+    Returns:
+        Names of the regular files in the directory, or an empty set
+        if the directory does not exist.
+
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+def read_fetched_sitemap(link: Link, future: typing.Future) -> typing.Optional[str]:
+    """Read sitemap from a pending request.
+
+    Args:
+        link: Link object of the sitemap.
+        future (concurrent.futures.Future): Pending request to the sitemap,
+            as returned by :class:`requests_futures.sessions.FuturesSession`.
+
+    Returns:
+        Content of the sitemap, or :data:`None` if failed.
+
+    See Also:
+        * :func:`darc.proxy.null.save_sitemap`
+
+    """
+    try:
+        response: typing.Response = future.result()
+    except requests.RequestException as error:
+        print(render_error(f'[SITEMAP] Failed on {link.url} <{error}>',
+                           stem.util.term.Color.RED), file=sys.stderr)  # pylint: disable=no-member
+        return None
+
+    if not response.ok:
+        print(render_error(f'[SITEMAP] Failed on {link.url} [{response.status_code}]',
+                           stem.util.term.Color.RED), file=sys.stderr)  # pylint: disable=no-member
+        return None
+
+    # check content type
+    ct_type = get_content_type(response)
+    if ct_type == 'application/gzip':
+        try:
+            sitemap_text = gzip.decompress(response.content).decode()
+        except UnicodeDecodeError:
+            sitemap_text = response.text
+    elif ct_type in ['text/xml', 'text/html']:
+        sitemap_text = response.text
+        save_sitemap(link, sitemap_text)
+    else:
+        print(render_error(f'[SITEMAP] Unresolved content type on {link.url} ({ct_type}',
+                           stem.util.term.Color.RED), file=sys.stderr)  # pylint: disable=no-member
+        return None
+
+    print(f'[SITEMAP] Fetched {link.url}')
+    return sitemap_text
 
 
 def fetch_sitemap(link: Link):
@@ -235,12 +387,71 @@ def fetch_sitemap(link: Link):
     Returns:
         Contents of ``robots.txt`` and sitemaps.
 
+    Note:
+        The sitemaps are fetched concurrently through
+        :class:`requests_futures.sessions.FuturesSession`, level by
+        level as further sitemaps are referenced from sitemap indexes.
+
+        The hosts whose ``robots.txt`` and sitemaps have been fetched
+        are recorded in process for :data:`~darc.proxy.null.ROBOTS_TTL`
+        seconds, during which the links from the sitemaps are considered
+        already queued and the host will be skipped.
+
+        Should the host be fetched by another thread at the moment, the
+        function will wait for it to finish instead of fetching again, and
+        will re-raise the error should such fetch fail.
+
     See Also:
         * :func:`darc.proxy.null.read_robots`
         * :func:`darc.proxy.null.read_sitemap`
         * :func:`darc.parse.get_sitemap`
 
     """
+    with _ROBOTS_LOCK:
+        fetching = False
+        fetched_at = _ROBOTS_CACHE.get(link.host)
+        if fetched_at is not None:
+            fresh = ROBOTS_TTL is None or time.monotonic() - fetched_at < ROBOTS_TTL
+        else:
+            fresh = False
+
+        if not fresh:
+            future = _INFLIGHT.get(link.host)
+            if future is None:
+                fetching = True
+                future = _INFLIGHT[link.host] = concurrent.futures.Future()
+
+    if not fetching:
+        if not fresh:
+            future.result()
+        print(stem.util.term.format(f'[ROBOTS] Cached {link.url}',
+                                    stem.util.term.Color.YELLOW))  # pylint: disable=no-member
+        return
+
+    try:
+        _fetch_sitemap(link)
+    except BaseException as error:
+        future.set_exception(error)
+        raise
+    else:
+        future.set_result(None)
+    finally:
+        with _ROBOTS_LOCK:
+            del _INFLIGHT[link.host]
+
+
+def _fetch_sitemap(link: Link):
+    """Fetch sitemap.
+
+    Args:
+        link: Link object to fetch for its sitemaps.
+
+    See Also:
+        * :func:`darc.proxy.null.fetch_sitemap`
+
+    """
+    global _ROBOTS_PRUNE
+
     robots_path = have_robots(link)
     if robots_path is not None:
 
@@ -251,16 +462,16 @@ def fetch_sitemap(link: Link):
 
     else:
 
-        robots_link = parse_link(urljoin(link.url, '/robots.txt'))
+        robots_link = parse_link(f'{link.url_parse.scheme}://{link.url_parse.netloc}/robots.txt')
         print(f'[ROBOTS] Checking {robots_link.url}')
 
-        with request_session(robots_link) as session:
-            try:
-                response = session.get(robots_link.url)
-            except requests.RequestException as error:
-                print(render_error(f'[ROBOTS] Failed on {robots_link.url} <{error}>',
-                                   stem.util.term.Color.RED), file=sys.stderr)  # pylint: disable=no-member
-                return
+        session = request_session(robots_link)
+        try:
+            response = session.get(robots_link.url)
+        except requests.RequestException as error:
+            print(render_error(f'[ROBOTS] Failed on {robots_link.url} <{error}>',
+                               stem.util.term.Color.RED), file=sys.stderr)  # pylint: disable=no-member
+            return
 
         if response.ok:
             ct_type = get_content_type(response)
@@ -278,51 +489,54 @@ def fetch_sitemap(link: Link):
             robots_text = ''
 
     sitemaps = read_robots(link, robots_text, host=link.host)
-    for sitemap_link in sitemaps:
-        sitemap_path = have_sitemap(sitemap_link)
-        if sitemap_path is not None:
-
-            print(stem.util.term.format(f'[SITEMAP] Cached {link.url}',
-                                        stem.util.term.Color.YELLOW))  # pylint: disable=no-member
-            with open(sitemap_path) as file:
-                sitemap_text = file.read()
-
-        else:
-
-            print(f'[SITEMAP] Fetching {sitemap_link.url}')
-
-            with request_session(sitemap_link) as session:
-                try:
-                    response = session.get(sitemap_link.url)
-                except requests.RequestException as error:
-                    print(render_error(f'[SITEMAP] Failed on {sitemap_link.url} <{error}>',
-                                       stem.util.term.Color.RED), file=sys.stderr)  # pylint: disable=no-member
+    with request_session(link, futures=True) as session:
+        visited = set()
+        files_map = dict()
+        pending = sitemaps
+        while pending:
+            pending = [sitemap_link for sitemap_link in pending if sitemap_link not in visited]
+            visited.update(pending)
+
+            # fetch all uncached sitemaps concurrently
+            future_map = dict()
+            for sitemap_link in pending:
+                # list each host folder once instead of checking every sitemap
+                files = files_map.get(sitemap_link.base)
+                if files is None:
+                    files = files_map[sitemap_link.base] = _list_files(sitemap_link.base)
+                if f'sitemap_{sitemap_link.name}.xml' not in files:
+                    print(f'[SITEMAP] Fetching {sitemap_link.url}')
+                    future_map[sitemap_link] = session.get(sitemap_link.url)
+
+            nested = list()
+            link_list = list()
+            for sitemap_link in pending:
+                future = future_map.get(sitemap_link)
+                if future is None:
+                    sitemap_text = read_cached_sitemap(sitemap_link)
+                else:
+                    sitemap_text = read_fetched_sitemap(sitemap_link, future)
+                if sitemap_text is None:
                     continue
 
-            if not response.ok:
-                print(render_error(f'[SITEMAP] Failed on {sitemap_link.url} [{response.status_code}]',
-                                   stem.util.term.Color.RED), file=sys.stderr)  # pylint: disable=no-member
-                continue
+                # get more sitemaps
+                nested.extend(get_sitemap(sitemap_link, sitemap_text, host=link.host))
 
-            # check content type
-            ct_type = get_content_type(response)
-            if ct_type == 'application/gzip':
-                try:
-                    sitemap_text = gzip.decompress(response.content).decode()
-                except UnicodeDecodeError:
-                    sitemap_text = response.text
-            elif ct_type in ['text/xml', 'text/html']:
-                sitemap_text = response.text
-                save_sitemap(sitemap_link, sitemap_text)
-            else:
-                print(render_error(f'[SITEMAP] Unresolved content type on {sitemap_link.url} ({ct_type}',
-                                   stem.util.term.Color.RED), file=sys.stderr)  # pylint: disable=no-member
-                continue
+                # extract links from sitemap
+                link_list.extend(read_sitemap(link, sitemap_text))
+
+            # add link to queue
+            save_requests(link_list)
 
-            print(f'[SITEMAP] Fetched {sitemap_link.url}')
+            pending = nested
 
-        # get more sitemaps
-        sitemaps.extend(get_sitemap(sitemap_link, sitemap_text, host=link.host))
+    now = time.monotonic()
+    with _ROBOTS_LOCK:
+        _ROBOTS_CACHE[link.host] = now
 
-        # add link to queue
-        save_requests(read_sitemap(link, sitemap_text))
+        # prune expired hosts
+        if ROBOTS_TTL is not None and now >= _ROBOTS_PRUNE:
+            _ROBOTS_PRUNE = now + ROBOTS_TTL
+            for host, fetched_at in list(_ROBOTS_CACHE.items()):
+                if now - fetched_at >= ROBOTS_TTL:
+                    del _ROBOTS_CACHE[host]
@@ -63,6 +63,8 @@ _TOR_BS_FLAG = not _MNG_TOR  # only if Tor managed through stem
 _TOR_CTRL = None
 # Tor daemon process
 _TOR_PROC = None
+# Tor session renewal counter
+_TOR_RENEW = 0
 # Tor bootstrap config
 _TOR_CONFIG = {
     'SocksPort': TOR_PORT,
@@ -79,8 +81,16 @@ if DEBUG:
 
 
 def renew_tor_session():
-    """Renew Tor session."""
-    global _TOR_CTRL
+    """Renew Tor session.
+
+    Note:
+        As ``NEWNYM`` only affects new streams, the function increases
+        :data:`~darc.proxy.tor._TOR_RENEW` on success, so that the cached
+        sessions (c.f. :func:`~darc.requests.request_session`) will be
+        rebuilt without the pooled connections on the old circuits.
+
+    """
+    global _TOR_CTRL, _TOR_RENEW
 
     try:
         # Tor controller process
@@ -88,6 +98,7 @@ def renew_tor_session():
             _TOR_CTRL = stem.control.Controller.from_port(port=int(TOR_CTRL))
             _TOR_CTRL.authenticate(TOR_PASS)
         _TOR_CTRL.signal(stem.Signal.NEWNYM)  # pylint: disable=no-member
+        _TOR_RENEW += 1
     except Exception as error:
         warning = warnings.formatwarning(error, TorRenewFailed, __file__, 88,
                                          '_TOR_CTRL = stem.control.Controller.from_port(port=int(TOR_CTRL))')
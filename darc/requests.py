@@ -8,9 +8,12 @@ project.
 
 """
 
+import threading
+
 import requests
 import requests_futures.sessions
 
+import darc.proxy.tor
 import darc.typing as typing
 from darc.const import DARC_CPU
 from darc.error import UnsupportedLink
@@ -18,6 +21,10 @@ from darc.link import Link
 from darc.proxy.i2p import I2P_REQUESTS_PROXY
 from darc.proxy.tor import TOR_REQUESTS_PROXY
 
+#: threading.local: Thread-local storage of the :class:`requests.Session`
+#: objects, c.f. :func:`~darc.requests.request_session`.
+_SESSION_LOCAL = threading.local()
+
 
 def default_user_agent(name: str = 'python-darc', proxy: typing.Optional[str] = None) -> str:
     """Generates the default user agent.
@@ -54,6 +61,13 @@ def request_session(link: Link, futures: bool = False) -> typing.Union[typing.Se
         :exc:`UnsupportedLink`: If the proxy type of ``link``
             if not specified in the :data:`~darc.proxy.LINK_MAP`.
 
+    Note:
+        Plain :class:`requests.Session` objects are created once per thread
+        and proxy type, so that the connection pools are reused across links;
+        their cookies are cleared on each call. Callers shall **NOT** close
+        such sessions. The sessions are rebuilt once the Tor session is
+        renewed (c.f. :func:`~darc.proxy.tor.renew_tor_session`).
+
     See Also:
         * :data:`darc.proxy.LINK_MAP`
 
@@ -64,7 +78,24 @@ def request_session(link: Link, futures: bool = False) -> typing.Union[typing.Se
     if factory is None:
         raise UnsupportedLink(link.url)
 
-    return factory(futures=futures)
+    if futures:
+        return factory(futures=True)
+
+    renew = darc.proxy.tor._TOR_RENEW  # pylint: disable=protected-access
+    sessions = getattr(_SESSION_LOCAL, 'sessions', None)
+    if sessions is None or _SESSION_LOCAL.renew != renew:
+        # drop pooled connections on the old Tor circuits
+        for session in (sessions or dict()).values():
+            session.close()
+        sessions = _SESSION_LOCAL.sessions = dict()
+        _SESSION_LOCAL.renew = renew
+
+    session = sessions.get(factory)
+    if session is None:
+        session = sessions[factory] = factory(futures=False)
+    else:
+        session.cookies.clear()
+    return session
 
 
 def i2p_session(futures: bool = False) -> typing.Union[typing.Session, typing.FuturesSession]:
@@ -8,11 +8,14 @@ project.
 
 """
 
+import contextlib
 import getpass
 import platform
 import shutil
+import threading
 
 import selenium
+import selenium.common.exceptions
 
 import darc.typing as typing
 from darc.const import DEBUG
@@ -21,6 +24,68 @@ from darc.link import Link
 from darc.proxy.i2p import I2P_PORT, I2P_SELENIUM_PROXY
 from darc.proxy.tor import TOR_PORT, TOR_SELENIUM_PROXY
 
+#: threading.local: Thread-local storage of the web drivers,
+#: c.f. :func:`~darc.selenium.request_driver`.
+_DRIVER_LOCAL = threading.local()
+#: Tuple[int, int]: Default window size of the web drivers,
+#: i.e. that of headless Google Chrome.
+_WINDOW_SIZE = (800, 600)
+#: int: Maximum number of links loaded by a web driver before it is
+#: recycled, so that browser state which cannot be reset (e.g. storage
+#: of third-party frames) will not pile up.
+_DRIVER_REUSE = 100
+
+
+def _get_drivers() -> typing.Dict[typing.Callable[[], typing.Driver], typing.Driver]:
+    """Get web drivers of current thread.
+
+    Returns:
+        Mapping of driver factory functions to the web driver objects
+        created in current thread.
+
+    """
+    drivers = getattr(_DRIVER_LOCAL, 'drivers', None)
+    if drivers is None:
+        drivers = _DRIVER_LOCAL.drivers = dict()
+    return drivers
+
+
+def _get_uses() -> typing.Dict[typing.Callable[[], typing.Driver], int]:
+    """Get usage counts of web drivers of current thread.
+
+    Returns:
+        Mapping of driver factory functions to the number of links
+        requested for the web driver objects created in current thread.
+
+    """
+    uses = getattr(_DRIVER_LOCAL, 'uses', None)
+    if uses is None:
+        uses = _DRIVER_LOCAL.uses = dict()
+    return uses
+
+
+def _reset_driver(driver: typing.Driver):
+    """Reset a reused selenium driver.
+
+    The function restores the default window size (c.f.
+    :data:`~darc.selenium._WINDOW_SIZE`), as the crawler resizes
+    the window for screenshots, removes cookies of all sites through
+    the ``Network.clearBrowserCookies`` DevTools command, and removes
+    all data (storage, caches, service workers, etc.) of the origin
+    of the previous page through ``Storage.clearDataForOrigin``.
+
+    Args:
+        driver: Web driver to be reset.
+
+    """
+    driver.set_window_size(*_WINDOW_SIZE)
+    driver.execute_cdp_cmd('Network.clearBrowserCookies', dict())
+
+    # opaque origins, e.g. of ``data:`` URLs, are serialised as ``null``
+    origin = driver.execute_script('return window.location.origin;')
+    if origin and origin != 'null':
+        driver.execute_cdp_cmd('Storage.clearDataForOrigin', dict(origin=origin, storageTypes='all'))
+
 
 def request_driver(link: Link) -> typing.Driver:
     """Get selenium driver.
@@ -35,16 +100,80 @@ def request_driver(link: Link) -> typing.Driver:
         UnsupportedLink: If the proxy type of ``link``
             if not specified in the :data:`~darc.proxy.LINK_MAP`.
 
+    Note:
+        As launching Google Chrome is rather expensive, the web driver
+        is created once per thread and proxy type, and reused for later
+        links, which will be reset through :func:`~darc.selenium._reset_driver`
+        before reuse, and recycled after :data:`~darc.selenium._DRIVER_REUSE`
+        links. Callers shall **NOT** quit the returned web driver, but
+        call :func:`~darc.selenium.drop_driver` if it is broken, and
+        :func:`~darc.selenium.close_drivers` when finished.
+
     See Also:
         * :data:`darc.proxy.LINK_MAP`
 
     """
     from darc.proxy import LINK_MAP  # pylint: disable=import-outside-toplevel
 
-    _, driver = LINK_MAP[link.proxy]
-    if driver is None:
+    _, factory = LINK_MAP[link.proxy]
+    if factory is None:
         raise UnsupportedLink(link.url)
-    return driver()
+
+    drivers = _get_drivers()
+    uses = _get_uses()
+
+    driver = drivers.get(factory)
+    if driver is not None:
+        if uses.get(factory, 0) < _DRIVER_REUSE:
+            try:
+                _reset_driver(driver)
+                uses[factory] += 1
+                return driver
+            except selenium.common.exceptions.WebDriverException:
+                pass
+        drop_driver(link)
+
+    driver = drivers[factory] = factory()
+    driver.set_window_size(*_WINDOW_SIZE)
+    uses[factory] = 1
+    return driver
+
+
+def drop_driver(link: Link):
+    """Quit and discard the selenium driver of current thread.
+
+    Args:
+        link: Link whose :class:`~selenium.webdriver.Chrome` is to be discarded.
+
+    See Also:
+        * :func:`darc.selenium.request_driver`
+
+    """
+    from darc.proxy import LINK_MAP  # pylint: disable=import-outside-toplevel
+
+    _, factory = LINK_MAP[link.proxy]
+    _get_uses().pop(factory, None)
+    driver = _get_drivers().pop(factory, None)
+    if driver is None:
+        return
+
+    with contextlib.suppress(Exception):
+        driver.quit()
+
+
+def close_drivers():
+    """Quit all selenium drivers of current thread.
+
+    See Also:
+        * :func:`darc.selenium.request_driver`
+
+    """
+    _get_uses().clear()
+    drivers = _get_drivers()
+    while drivers:
+        _, driver = drivers.popitem()
+        with contextlib.suppress(Exception):
+            driver.quit()
 
 
 def get_options(type: str = 'null') -> typing.Options:  # pylint: disable=redefined-builtin
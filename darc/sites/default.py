@@ -24,11 +24,16 @@ def crawler(session: typing.Session, link: Link) -> typing.Response:
     Returns:
         requests.Response: The final response object with crawled data.
 
+    Note:
+        The response body is streamed, i.e. it will only be downloaded
+        once accessed, so that documents of ignored content types can be
+        discarded without fetching them.
+
     See Also:
         * :func:`darc.crawl.crawler`
 
     """
-    response = session.get(link.url, allow_redirects=True)
+    response = session.get(link.url, allow_redirects=True, stream=True)
     return response
 
 
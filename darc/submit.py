@@ -29,6 +29,7 @@ import base64
 import dataclasses
 import glob
 import json
+import mmap
 import os
 import pprint
 import shutil
@@ -95,6 +96,28 @@ def get_metadata(link: Link) -> typing.Dict[str, str]:
     return metadata
 
 
+def read_file(path: str) -> str:
+    """Read file and encode its content.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        The *base64* encoded content of the file.
+
+    Note:
+        Files no smaller than :data:`mmap.PAGESIZE` are memory-mapped
+        and encoded directly from the mapping, so that the content
+        is not copied into an intermediate :obj:`bytes` buffer.
+
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size < mmap.PAGESIZE:
+            return base64.b64encode(file.read()).decode()
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return base64.b64encode(content).decode()
+
+
 def get_robots(link: Link) -> typing.Optional[File]:  # pylint: disable=inconsistent-return-statements
     """Read ``robots.txt``.
 
@@ -118,11 +141,9 @@ def get_robots(link: Link) -> typing.Optional[File]:  # pylint: disable=inconsis
     path = os.path.join(link.base, 'robots.txt')
     if not os.path.isfile(path):
         return
-    with open(path, 'rb') as file:
-        content = file.read()
     data = dict(
         path=os.path.relpath(path, PATH_DB),
-        data=base64.b64encode(content).decode(),
+        data=read_file(path),
     )
     return data
 
@@ -153,11 +174,9 @@ def get_sitemap(link: Link) -> typing.Optional[typing.List[File]]:  # pylint: di
 
     data_list = list()
     for path in path_list:
-        with open(path, 'rb') as file:
-            content = file.read()
         data = dict(
             path=os.path.relpath(path, PATH_DB),
-            data=base64.b64encode(content).decode(),
+            data=read_file(path),
         )
         data_list.append(data)
     return data_list
@@ -189,11 +208,9 @@ def get_hosts(link: Link) -> typing.Optional[File]:  # pylint: disable=inconsist
     path = os.path.join(link.base, 'hosts.txt')
     if not os.path.isfile(path):
         return
-    with open(path, 'rb') as file:
-        content = file.read()
     data = dict(
         path=os.path.relpath(path, PATH_DB),
-        data=base64.b64encode(content).decode(),
+        data=read_file(path),
     )
     return data
 
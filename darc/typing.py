@@ -3,6 +3,7 @@
 # pylint: disable=unused-wildcard-import
 
 import argparse
+import concurrent.futures
 import datetime
 import enum
 import ipaddress
@@ -38,6 +39,9 @@ Session = requests.Session
 # requests_futures.sessions.FuturesSession
 FuturesSession = requests_futures.sessions.FuturesSession
 
+# concurrent.futures.Future
+Future = concurrent.futures.Future
+
 # queue.Queue
 Queue = queue.Queue
 